@@ -1,19 +1,17 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from waveforms import pulse_train
+
 plt.rcParams['font.sans-serif'] = ['SimSun']
 plt.rcParams['axes.unicode_minus'] = False
 
 t = np.linspace(-3, 3, 600)
 
-# 创建周期矩形脉冲
-y1 = np.zeros_like(t)
-pulse_positions = [-2, 0, 2]
-pulse_width = 1
-
-for center in pulse_positions:
-    mask = (t >= center - pulse_width/2) & (t <= center + pulse_width/2)
-    y1[mask] = 1
+# 创建周期矩形脉冲（以 0 为中心）
+period = 2       # 脉冲周期
+pulse_width = 1  # 脉冲宽度
+y1 = pulse_train(t, period, duty=pulse_width/period, t0=-pulse_width/2)
 
 # 频谱计算 - 加密采样
 w_dense = np.linspace(-4*np.pi, 4*np.pi, 200)
@@ -2,6 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import rcParams
 
+from modulation import AMModulator
+
 # 设置中文字体和显示参数
 rcParams['font.sans-serif'] = ['SimHei']  # 用来正常显示中文标签
 rcParams['axes.unicode_minus'] = False    # 用来正常显示负号
@@ -11,10 +13,11 @@ omega_c = 10  # 载波角频率 (高频)
 omega_m = 1   # 调制信号角频率 (低频)
 t = np.linspace(0, 4*np.pi, 1000)  # 时间范围
 
-# 计算信号
-signal = 0.5 * (np.cos((omega_c + omega_m) * t) + np.cos((omega_c - omega_m) * t))
+# 计算信号：用调制器把 cos(omega_m * t) 调制到载波 cos(omega_c * t) 上
+# 根据三角恒等式，这等价于 0.5 * (cos((omega_c+omega_m)t) + cos((omega_c-omega_m)t))
+fs = 1 / (t[1] - t[0])
+signal = AMModulator(omega_c / (2 * np.pi), fs).process(np.cos(omega_m * t))
 
-# 根据三角恒等式，这等价于 cos(omega_m * t) * cos(omega_c * t)
 # 包络线就是 ±cos(omega_m * t)
 envelope_upper = np.cos(omega_m * t)   # 上包络线
 envelope_lower = - np.cos(omega_m * t)  # 下包络线
@@ -1,28 +1,49 @@
 import matplotlib.pyplot as plt
 import numpy as np
+from functools import lru_cache
 
 plt.rcParams['font.sans-serif'] = ['SimSun']
 plt.rcParams['axes.unicode_minus'] = False
 
 # 定义狄利克雷核函数
 def dirichlet_kernel(x, N):
-    """狄利克雷核: D_N(x) = sin((N+1/2)x) / sin(x/2)"""
-    if np.allclose(x, 0):
-        return 2*N + 1  # 在x=0处的极限值
-    return np.sin((N + 0.5) * x) / np.sin(x / 2)
+    """
+    狄利克雷核: D_N(x) = sin((N+1/2)x) / sin(x/2)
+    逐元素计算，在 x 为 2pi 的整数倍处取极限值 2N+1；
+    N 可以是数组，与 x 按广播规则组合（如 N[:, None] 与 x 得到一批核）
+    """
+    x = np.asarray(x, dtype=float)
+    N = np.asarray(N)
+    # 把 x 约化到 [-pi, pi] 判断是否落在可去奇点上
+    r = x - 2 * np.pi * np.round(x / (2 * np.pi))
+    at_pole = np.abs(r) < 1e-12
+    with np.errstate(divide='ignore', invalid='ignore'):
+        D = np.sin((N + 0.5) * x) / np.sin(x / 2)
+    return np.where(at_pole, 2 * N + 1, D)
+
+@lru_cache(maxsize=32)
+def dirichlet_kernel_table(N, start, stop, num):
+    """
+    在 np.linspace(start, stop, num) 网格上的 D_N 表，按 (N, 网格) 缓存，
+    返回只读的 (x, D_N)，重复绘图或卷积时不再重新计算
+    """
+    x = np.linspace(start, stop, num)
+    D = dirichlet_kernel(x, N)
+    x.flags.writeable = False
+    D.flags.writeable = False
+    return x, D
 
 # 定义包络函数
 def envelope_function(x, N):
     """包络函数: 1/|sin(x/2)|"""
-    return 1 / np.abs(np.sin(x / 2))
+    with np.errstate(divide='ignore'):
+        return 1 / np.abs(np.sin(x / 2))
 
 # 参数设置
 N = 10  # 核的阶数
-x = np.linspace(-3*np.pi, 3*np.pi, 2000)
-x = x[~np.isclose(x, 0)]  # 移除零点附近避免除零
 
-# 计算狄利克雷核和包络
-D_N = dirichlet_kernel(x, N)
+# 计算狄利克雷核和包络（取奇数个点使网格包含 x=0 处的峰值）
+x, D_N = dirichlet_kernel_table(N, -3*np.pi, 3*np.pi, 2001)
 envelope_upper = envelope_function(x, N)
 envelope_lower = -envelope_upper
 
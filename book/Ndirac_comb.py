@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from lattice import lattice_points
+
 # 设置图形
 fig = plt.figure(figsize=(14, 6))
 gs = fig.add_gridspec(1, 2, width_ratios=[1, 1.5])
@@ -12,20 +14,10 @@ ax1 = fig.add_subplot(gs[0])
 u = np.array([1, 2])
 v = np.array([2, 1])
 
-# 生成格点系数
-k_range = 4
-n = np.arange(-k_range, k_range + 1)
-m = np.arange(-k_range, k_range + 1)
-N, M = np.meshgrid(n, m)
-
-# 计算格点坐标
-X_lat = N * u[0] + M * v[0]
-Y_lat = N * u[1] + M * v[1]
-
-# 绘制格点 (进行简单的视场裁剪)
+# 只枚举视场内的格点 (进行简单的视场裁剪)
 view_lim = 8
-mask = (np.abs(X_lat) <= view_lim) & (np.abs(Y_lat) <= view_lim)
-ax1.scatter(X_lat[mask], Y_lat[mask], color='black', s=20, zorder=5)
+points = lattice_points(np.column_stack([u, v]), -view_lim, view_lim)
+ax1.scatter(points[:, 0], points[:, 1], color='black', s=20, zorder=5)
 
 # 绘制二维坐标轴
 ax1.plot([-view_lim - 1, view_lim + 1], [0, 0], 'k-', lw=1)
@@ -2,6 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+from separable import gaussian_nd
+
 # 参数
 a = 1.0
 n = 100
@@ -12,8 +14,8 @@ x = np.linspace(-lim, lim, n)
 y = np.linspace(-lim, lim, n)
 X, Y = np.meshgrid(x, y)
 
-# 计算二维高斯函数值作为高度 Z (z = f(x, y))
-Z = np.exp(-a * (X**2 + Y**2))
+# 计算二维高斯函数值作为高度 Z (z = f(x, y))，按 exp(-a x^2) * exp(-a y^2) 可分离求值
+Z = gaussian_nd(x, y, a=a, indexing='xy')
 
 # 绘图
 fig = plt.figure(figsize=(10, 8))
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from sampling import alias_frequency
+
 # 设置中文字体和图形参数
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
@@ -19,7 +21,7 @@ t_sampled = np.arange(0, 2, 1/fs_low)
 sampled_signal = np.cos(2 * np.pi * f_original * t_sampled)
 
 # 计算混叠后的低频信号频率（根据采样定理）
-f_alias = abs(fs_low - f_original)  # 混叠频率
+f_alias = alias_frequency(f_original, fs_low)  # 混叠频率，即 |f - fs*round(f/fs)|
 alias_signal = np.cos(2 * np.pi * f_alias * t_continuous)  # 混叠后的信号
 
 # 绘制原信号（浅色）
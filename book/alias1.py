@@ -2,6 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy import signal
 
+from sampling import periodize_spectrum, sinc_reconstruct
+
 # 设置中文字体和图形参数
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
@@ -67,33 +69,15 @@ for n in range(-3, 4):
         shifted_freq = freq_continuous + n * fs_low
         axes[1, 1].plot(shifted_freq, np.abs(spectrum), 'r-', linewidth=1, alpha=0.45)
 
-# 计算实际发生混叠的频率区间：用阈值检测原频谱与任意平移频谱同时有显著能量的区域
+# 一次性计算周期化频谱：总和、各平移副本以及实际发生混叠的频率区间
+# （原频谱与任意平移频谱同时超过 5% 峰值的区域）
 nyquist = fs_low / 2
-threshold = 0.05 * np.max(np.abs(spectrum))
-# 构建一个布尔掩码，标记所有发生实际重叠的位置
-alias_mask = np.zeros_like(freq_continuous, dtype=bool)
-for n in range(-3, 4):
-    if n == 0:
-        continue
-    # 将平移谱在 freq_continuous 网格上取样（相当于在频率轴上把谱向左右平移）
-    shifted_vals = np.interp(freq_continuous, freq_continuous - n * fs_low, np.abs(spectrum), left=0, right=0)
-    overlap = (np.abs(spectrum) > threshold) & (shifted_vals > threshold)
-    alias_mask = alias_mask | overlap
-
-# 将 alias_mask 连续区间转为频率区间并标注
-if np.any(alias_mask):
-    mask = alias_mask.astype(int)
-    diff = np.diff(mask)
-    starts = np.where(diff == 1)[0] + 1
-    ends = np.where(diff == -1)[0] + 1
-    if mask[0] == 1:
-        starts = np.r_[0, starts]
-    if mask[-1] == 1:
-        ends = np.r_[ends, len(mask)]
-    for s, e in zip(starts, ends):
-        fstart = freq_continuous[s]
-        fend = freq_continuous[e - 1]
-        axes[1, 1].axvspan(fstart, fend, alpha=0.25, color='red', label='混叠区域' if s == starts[0] else '')
+Ncopy = 5
+periodized, copies, alias_intervals = periodize_spectrum(freq_continuous, np.abs(spectrum), fs_low, Ncopy)
+
+# 标注混叠区间
+for i, (fstart, fend) in enumerate(alias_intervals):
+    axes[1, 1].axvspan(fstart, fend, alpha=0.25, color='red', label='混叠区域' if i == 0 else '')
 
 axes[1, 1].set_xlabel('频率 (Hz)')
 axes[1, 1].set_ylabel('幅度')
@@ -109,11 +93,7 @@ axes[2, 0].plot(t_continuous, gaussian_signal, color='blue', linewidth=1.2, alph
 axes[2, 0].plot(t_sampled, sampled_signal, 'ro', markersize=6, label='采样点')
 
 # 从采样点重建信号（使用sinc插值）
-reconstructed_signal = np.zeros_like(t_continuous)
-for i, t_val in enumerate(t_continuous):
-    for j, (t_sample, sample_val) in enumerate(zip(t_sampled, sampled_signal)):
-        # 使用 np.sinc，它本身处理 t_val==t_sample 的情况
-        reconstructed_signal[i] += sample_val * np.sinc(fs_low * (t_val - t_sample))
+reconstructed_signal = sinc_reconstruct(t_continuous, t_sampled, sampled_signal, fs_low)
 
 axes[2, 0].plot(t_continuous, reconstructed_signal, 'r-', linewidth=2, label='重建信号')
 axes[2, 0].set_xlabel('时间 (s)')
@@ -124,13 +104,6 @@ axes[2, 0].legend(fontsize=8)
 axes[2, 0].set_xlim(-1, 1)
 
 # 图6：频域加窗处理（对称显示）
-# 先计算周期化频域信号的总和（将所有平移谱在同一频率网格上相加）
-periodized = np.zeros_like(freq_continuous)
-Ncopy = 5
-for n in range(-Ncopy, Ncopy + 1):
-    shifted_vals = np.interp(freq_continuous, freq_continuous - n * fs_low, np.abs(spectrum), left=0, right=0)
-    periodized += shifted_vals
-
 # 绘制周期化总谱
 axes[2, 1].plot(freq_continuous, periodized, color='gray', linewidth=1.2, alpha=0.6, label='周期化频谱总和')
 
@@ -138,8 +111,7 @@ axes[2, 1].plot(freq_continuous, periodized, color='gray', linewidth=1.2, alpha=
 for n in range(-Ncopy, Ncopy + 1):
     if n == 0:
         continue
-    shifted_vals = np.interp(freq_continuous, freq_continuous - n * fs_low, np.abs(spectrum), left=0, right=0)
-    axes[2, 1].plot(freq_continuous, shifted_vals, color='gray', linewidth=0.8, alpha=0.12)
+    axes[2, 1].plot(freq_continuous, copies[n + Ncopy], color='gray', linewidth=0.8, alpha=0.12)
 
 # 绘制理想低通滤波器（窗函数），把窗函数按周期化谱峰值缩放以便可视化
 window = np.zeros_like(freq_continuous)
@@ -0,0 +1,215 @@
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from circuits import rlc_state_space, rlc_step_current
+from dispersion import DispersionPropagator
+from gibbs import fourier_series_sum
+from laplace import invert_laplace, rational
+from modulation import am_pipeline, envelope
+from sampling import line_spectrum, sinc_reconstruct
+from separable import gaussian_nd
+from shah_sinc import sinc_comb_sum
+from statespace import StateSpaceSimulator
+
+# 绘图所用数值核心的性能基准
+# 用法: python benchmarks.py [--max-size 1e7] [--out 结果.json] [--baseline 基准.json]
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+def _gibbs(n):
+    x = np.linspace(-2 * np.pi, 2 * np.pi, n)
+    return lambda: fourier_series_sum(x, 50)
+
+def _shah_sinc(n):
+    t = np.linspace(-1500, 1500, n)
+    return lambda: sinc_comb_sum(t, 1000)
+
+def _reconstruct(method, n_samples):
+    def setup(n):
+        t_samples = np.arange(n_samples) / 2.0
+        samples = np.exp(-(t_samples - t_samples.mean())**2 / 8)
+        # 输出网格与采样网格对齐，保证 'fft' 方法可用
+        L = max(1, n // n_samples)
+        t_out = t_samples[0] + np.arange(n) / (2.0 * L)
+        return lambda: sinc_reconstruct(t_out, t_samples, samples, 2.0, method=method)
+    return setup
+
+def _dispersion(n_factors):
+    def setup(n):
+        t = np.linspace(-10, 10, n)
+        wave = np.exp(-t**2 / 0.3)
+        factors = np.linspace(0, 2, n_factors)
+        return lambda: DispersionPropagator(wave, t[1] - t[0]).propagate(factors)
+    return setup
+
+def _line_spectrum(n):
+    t = np.linspace(-1, 1, n, endpoint=False)
+    x = np.exp(-t**2 / 0.1)
+    # 一个周期含 n/8 个采样点，谐波数不超过其一半
+    return lambda: line_spectrum(t, x, 2 / 8, min(100, n // 16 - 1))
+
+def _gaussian_nd(n):
+    # 三维网格，总点数约为 n
+    x = np.linspace(-3, 3, round(n ** (1 / 3)))
+    return lambda: gaussian_nd(x, x, x, dtype=np.float32)
+
+def _rlc_sweep(n):
+    # 100 个电阻值跨越三种阻尼情形，每个取 n/100 个时间点
+    t = np.linspace(0, 15, max(1, n // 100))
+    R = np.linspace(0.5, 4, 100)
+    return lambda: rlc_step_current(t, R[:, None], 1.0, 1.0)
+
+def _state_space(n):
+    sim = StateSpaceSimulator(*rlc_state_space([3.0, 2.0, 1.0], 1.0, 1.0), dt=1e-3)
+    u = np.ones(n)
+
+    def simulate():
+        sim.reset()
+        return sim.simulate(u)
+    return simulate
+
+def _am_pipeline(n):
+    fs = 48000.0
+    m = np.cos(2 * np.pi * 300 * np.arange(n) / fs)
+    chunks = np.array_split(m, max(1, n // 2**16))
+    return lambda: sum(len(d) for _, d in am_pipeline(chunks, 8000.0, fs, 1000.0))
+
+def _envelope(n):
+    # 一批长 1024 的调幅信号，总样本数约为 n
+    t = np.arange(1024) / 1000.0
+    depth = np.linspace(0.1, 0.9, max(1, n // 1024))[:, None]
+    x = (1 + depth * np.cos(2 * np.pi * 5 * t)) * np.cos(2 * np.pi * 100 * t)
+    return lambda: envelope(x, 1000.0)
+
+def _invert_laplace(n):
+    # 一批 RLC 电流 I(s) = 1/(s^2 + R s + 1)，每个在 100 个时刻求逆变换
+    R = np.linspace(0.5, 4, max(1, n // 100))
+    H = rational([1.0], np.column_stack([np.ones_like(R), R, np.ones_like(R)]))
+    t = np.linspace(0.1, 15, 100)
+    return lambda: invert_laplace(H, t)
+
+# 名称 -> (构造待测函数的 setup(n), 该核心允许的最大规模)
+BENCHMARKS = {
+    'gibbs.fourier_series_sum': (_gibbs, 10**7),
+    'shah_sinc.sinc_comb_sum': (_shah_sinc, 10**7),
+    'sampling.sinc_reconstruct[fft]': (_reconstruct('fft', 200), 10**7),
+    'sampling.sinc_reconstruct[direct]': (_reconstruct('direct', 200), 10**6),
+    'dispersion.DispersionPropagator': (_dispersion(8), 10**6),
+    'sampling.line_spectrum': (_line_spectrum, 10**7),
+    'separable.gaussian_nd': (_gaussian_nd, 10**7),
+    'circuits.rlc_step_current': (_rlc_sweep, 10**7),
+    'statespace.StateSpaceSimulator': (_state_space, 10**6),
+    'modulation.am_pipeline': (_am_pipeline, 10**7),
+    'modulation.envelope': (_envelope, 10**7),
+    'laplace.invert_laplace': (_invert_laplace, 10**5),
+}
+
+def measure(func, repeat):
+    """返回 (最短耗时秒数, 峰值内存字节数)；计时与内存跟踪分开进行，互不干扰"""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def run(names=None, max_size=SIZES[-1], repeat=3):
+    results = []
+    for name in names or BENCHMARKS:
+        setup, limit = BENCHMARKS[name]
+        for n in SIZES:
+            if n > min(limit, max_size):
+                break
+            seconds, peak = measure(setup(n), repeat if n < 10**6 else 1)
+            results.append({'kernel': name, 'size': n, 'seconds': seconds, 'peak_bytes': peak})
+            print(f"{name:<36} {n:>10} {seconds * 1e3:12.3f} ms {peak / 2**20:10.1f} MiB", flush=True)
+    return {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+
+def _scaling(rows):
+    """相邻规模间的经验复杂度指数 log(t2/t1) / log(n2/n1)"""
+    rows = sorted(rows, key=lambda r: r['size'])
+    return {
+        b['size']: math.log(b['seconds'] / a['seconds']) / math.log(b['size'] / a['size'])
+        for a, b in zip(rows, rows[1:])
+    }
+
+def compare(current, baseline, tolerance=1.25, exponent_slack=0.25, min_seconds=1e-3):
+    """
+    与基准比较，返回回归列表：
+    某规模耗时超过基准的 tolerance 倍，或经验复杂度指数比基准高出 exponent_slack；
+    耗时低于 min_seconds 的测量受计时噪声影响太大，不参与比较
+    """
+    def by_kernel(report):
+        table = {}
+        for row in report['results']:
+            table.setdefault(row['kernel'], []).append(row)
+        return table
+
+    cur, base = by_kernel(current), by_kernel(baseline)
+    regressions = []
+    for kernel in sorted(cur.keys() & base.keys()):
+        cur[kernel] = [r for r in cur[kernel] if r['seconds'] >= min_seconds]
+        base[kernel] = [r for r in base[kernel] if r['seconds'] >= min_seconds]
+        base_rows = {r['size']: r for r in base[kernel]}
+        for row in cur[kernel]:
+            ref = base_rows.get(row['size'])
+            if ref and row['seconds'] / ref['seconds'] > tolerance:
+                regressions.append(f"{kernel} n={row['size']}: "
+                                   f"{ref['seconds'] * 1e3:.3f} ms -> {row['seconds'] * 1e3:.3f} ms")
+        base_exp = _scaling(base[kernel])
+        for n, exp in _scaling(cur[kernel]).items():
+            if n in base_exp and exp - base_exp[n] > exponent_slack:
+                regressions.append(f"{kernel} n={n}: 复杂度指数 {base_exp[n]:.2f} -> {exp:.2f}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='数值核心的性能基准')
+    parser.add_argument('kernels', nargs='*', help=f"要运行的基准，默认全部: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--max-size', type=float, default=SIZES[-1], help='最大规模，默认 1e7')
+    parser.add_argument('--repeat', type=int, default=3, help='小规模时重复次数，取最短耗时')
+    parser.add_argument('--out', help='把结果写入该 JSON 文件')
+    parser.add_argument('--baseline', help='与该 JSON 基准比较，发现回归时返回非零')
+    parser.add_argument('--tolerance', type=float, default=1.25, help='允许的耗时倍数')
+    args = parser.parse_args(argv)
+
+    unknown = [k for k in args.kernels if k not in BENCHMARKS]
+    if unknown:
+        parser.error(f"未知的基准: {', '.join(unknown)}")
+
+    report = run(args.kernels, int(args.max_size), args.repeat)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"回归: {line}")
+        print(f"与基准比较：发现 {len(regressions)} 处回归")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import argparse
+import ast
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import runpy
+import sys
+import time
+import traceback
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata
+
+# 批量无界面地重新生成书中的插图
+# 用法: python build_figures.py [脚本名 ...] [-j 进程数] [--force]
+# 只有脚本指纹（源码、依赖的本地模块、渲染参数、库版本）变化时才重新渲染
+
+BOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+FIGURES_DIR = os.path.join(os.path.dirname(BOOK_DIR), 'Figures')
+FIGURE_DPI = 100
+CACHE_FILE = '.figure_cache.json'
+LIBRARIES = ('numpy', 'scipy', 'matplotlib')
+
+# 脚本 -> Figures/ 中的文件名（.tex 引用的图与 \includegraphics 中的名字一致），book/ 下每个绘图脚本一项
+FIGURES = {
+    '10.2.py': 'Figure_2.jpeg',
+    'AM.py': 'AM.jpeg',
+    'DirichletKernel.py': 'Figure_3.jpeg',
+    'Gauss.py': 'Gauss.jpeg',
+    'Ndirac_comb.py': 'n_comb.jpeg',
+    'Ngauss.py': 'n_gauss.jpeg',
+    'alias.py': 'cos.jpeg',
+    'alias1.py': 'alias.jpeg',
+    'contour2.py': 'contour2.jpeg',
+    'conv.py': 'conv.jpeg',
+    'damp.py': 'damp.jpeg',
+    'disct_sin.py': 'disct_sin.jpeg',
+    'draw_contour.py': 'contour.jpeg',
+    'filter_system_functions.py': 'Filter.jpeg',
+    'finite_sample.py': 'finite_sample.jpeg',
+    'fourier_series.py': 'fourier_series.jpeg',
+    'gibbs.py': 'gibbs.jpeg',
+    'lattice_sample.py': 'lattice_sample.jpeg',
+    'periodize.py': 'periodize.jpeg',
+    'sesan.py': 'sesan.jpeg',
+    'shah.py': 'shah.jpeg',
+    'shah_sinc.py': 'sinc_shah.jpeg',
+    'sigmaC.py': 'sigma_c.jpeg',
+    'stereographic.py': 'stereographic.jpeg',
+    'zero_phase.py': 'zero_phase.jpeg',
+}
+
+def _local_imports(path):
+    """脚本中 import 的、位于 book/ 下的本地模块文件"""
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split('.')[0])
+    files = (os.path.join(BOOK_DIR, name + '.py') for name in names)
+    return {f for f in files if os.path.isfile(f)}
+
+def _dependencies(script):
+    """脚本本身及其递归依赖的本地模块，按文件名排序"""
+    pending = [os.path.join(BOOK_DIR, script)]
+    seen = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        pending.extend(_local_imports(path) - seen)
+    return sorted(seen)
+
+def _library_versions():
+    """只读取安装元数据，不导入库本身，保证空构建足够快"""
+    versions = {'python': sys.version.split()[0]}
+    for name in LIBRARIES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+def fingerprint(script, versions=None):
+    """脚本指纹：源码及本地依赖的内容、输出文件名与渲染参数、库版本"""
+    h = hashlib.sha256()
+    for path in _dependencies(script):
+        h.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    params = {
+        'figure': FIGURES[script],
+        'dpi': FIGURE_DPI,
+        'backend': 'Agg',
+        'versions': versions or _library_versions(),
+    }
+    h.update(json.dumps(params, sort_keys=True).encode())
+    return h.hexdigest()
+
+def _load_cache(out_dir):
+    try:
+        with open(os.path.join(out_dir, CACHE_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(out_dir, cache):
+    path = os.path.join(out_dir, CACHE_FILE)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+def _init_worker():
+    """子进程初始化：切换到 Agg 后端，屏蔽缺失中文字体的告警"""
+    import matplotlib
+    matplotlib.use('Agg')
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    warnings.filterwarnings('ignore', message='Glyph .* missing from font')
+    if BOOK_DIR not in sys.path:
+        sys.path.insert(0, BOOK_DIR)
+    os.chdir(BOOK_DIR)
+
+def render_script(script, out_dir=FIGURES_DIR):
+    """
+    运行单个脚本，把其中的 plt.show() 替换为保存当前图像
+    返回 (脚本名, 输出路径, 耗时秒数, 错误信息或 None)
+    """
+    import matplotlib
+    import matplotlib.pyplot as plt
+    import matplotlib.pylab as pylab
+
+    out_path = os.path.join(out_dir, FIGURES[script])
+
+    def show(*args, **kwargs):
+        plt.gcf().savefig(out_path, dpi=FIGURE_DPI)
+
+    # 每个脚本从干净的绘图状态开始，避免上一个脚本的 rcParams 残留
+    matplotlib.rcdefaults()
+    plt.close('all')
+    plt.show = pylab.show = show
+    start = time.perf_counter()
+    error = None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(os.path.join(BOOK_DIR, script), run_name='__main__')
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        plt.close('all')
+    return script, out_path, time.perf_counter() - start, error
+
+def build(scripts=None, jobs=None, out_dir=FIGURES_DIR, force=False):
+    """
+    并行渲染给定脚本（默认全部），指纹未变且输出文件存在的脚本直接复用
+    返回按耗时降序排列的 (脚本名, 输出路径, 耗时秒数, 错误信息或 None, 是否复用缓存)
+    """
+    scripts = list(FIGURES) if scripts is None else scripts
+    unknown = [s for s in scripts if s not in FIGURES]
+    if unknown:
+        raise ValueError(f"未登记输出文件名的脚本: {', '.join(unknown)}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    cache = _load_cache(out_dir)
+    versions = _library_versions()
+    fingerprints = {s: fingerprint(s, versions) for s in scripts}
+    results = []
+    stale = []
+    for s in scripts:
+        out_path = os.path.join(out_dir, FIGURES[s])
+        if not force and cache.get(s) == fingerprints[s] and os.path.exists(out_path):
+            results.append((s, out_path, 0.0, None, True))
+        else:
+            stale.append(s)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            futures = [pool.submit(render_script, s, out_dir) for s in stale]
+            for future in as_completed(futures):
+                script, out_path, seconds, error = future.result()
+                if error is None:
+                    cache[script] = fingerprints[script]
+                else:
+                    cache.pop(script, None)
+                results.append((script, out_path, seconds, error, False))
+        _save_cache(out_dir, cache)
+    return sorted(results, key=lambda r: r[2], reverse=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='无界面并行重新生成 Figures/ 中的插图')
+    parser.add_argument('scripts', nargs='*', help='要渲染的脚本，默认全部')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='进程数，默认等于 CPU 核数')
+    parser.add_argument('-o', '--out-dir', default=FIGURES_DIR, help='输出目录')
+    parser.add_argument('-f', '--force', action='store_true', help='忽略缓存，全部重新渲染')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = build(args.scripts or None, args.jobs, args.out_dir, args.force)
+    wall = time.perf_counter() - start
+
+    failed = 0
+    for script, out_path, seconds, error, cached in results:
+        status = 'cached' if cached else 'ok' if error is None else 'FAILED'
+        print(f"{script:<28} {os.path.basename(out_path):<22} {seconds:8.2f} s  {status}")
+        if error is not None:
+            failed += 1
+            print(error, file=sys.stderr)
+    reused = sum(r[4] for r in results)
+    print(f"共 {len(results)} 个脚本，复用缓存 {reused} 个，失败 {failed} 个，总耗时 {wall:.2f} s")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
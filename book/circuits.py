@@ -0,0 +1,63 @@
+import numpy as np
+
+# RLC 串联电路的响应，参数与时间均可为数组并相互广播
+
+def _sinhc_sqrt(z):
+    """
+    sinh(sqrt(z)) / sqrt(z)，z < 0 时即 sin(sqrt(-z)) / sqrt(-z)，z = 0 时为 1
+    |z| 很小时用泰勒级数，避免 0/0 及临界阻尼附近的相消误差
+    """
+    z = np.atleast_1d(np.asarray(z, dtype=float))
+    out = 1 + z / 6 * (1 + z / 20 * (1 + z / 42))
+    pos = z >= 1e-3
+    neg = z <= -1e-3
+    root = np.sqrt(z[pos])
+    out[pos] = np.sinh(root) / root
+    root = np.sqrt(-z[neg])
+    out[neg] = np.sin(root) / root
+    return out
+
+def rlc_step_current(t, R, L, C, E=1.0):
+    """
+    零初始状态的 RLC 串联电路接入直流电压 E 后的电流:
+    i(t) = (E/L) * exp(alpha t) * sinh(w t) / w,  alpha = -R/(2L),  w^2 = (R^2 - 4L/C) / (4L^2)
+    w 为实数（过阻尼）、零（临界阻尼）、虚数（欠阻尼）三种情形由同一个表达式逐元素给出，
+    t、R、L、C、E 可为任意可相互广播的数组
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (t, R, L, C, E)))
+    shape = arrays[0].shape
+    t, R, L, C, E = (a.ravel() for a in arrays)
+    alpha = -R / (2 * L)
+    w2 = alpha**2 - 1 / (L * C)
+    z = w2 * t**2
+    i = np.exp(alpha * t) * t
+    i *= _sinhc_sqrt(np.minimum(z, 1.0))
+    # 过阻尼且 w t 较大时 exp(alpha t) 与 sinh(w t) 分别会下溢/上溢，改为合并指数
+    over = z > 1.0
+    a, w, tt = alpha[over], np.sqrt(w2[over]), t[over]
+    i[over] = (np.exp((a + w) * tt) - np.exp((a - w) * tt)) / (2 * w)
+    return (E / L * i).reshape(shape)
+
+def damping_regime(R, L, C, rtol=1e-9):
+    """阻尼情形：1 过阻尼，0 临界阻尼（相对误差 rtol 以内），-1 欠阻尼"""
+    R, L, C = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (R, L, C)))
+    d = R**2 - 4 * L / C
+    return np.where(np.abs(d) <= rtol * R**2, 0, np.sign(d)).astype(int)
+
+def rlc_state_space(R, L, C):
+    """
+    RLC 串联电路的状态空间模型，状态 x = (i, u_C)，输入为电源电压，输出为电流:
+    L di/dt = e - R i - u_C,  C du_C/dt = i
+    R、L、C 可为一维数组，返回带批量维的 (A, B, C_out, D)
+    """
+    R, L, C = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (R, L, C)))
+    P = len(R)
+    A = np.zeros((P, 2, 2))
+    A[:, 0, 0] = -R / L
+    A[:, 0, 1] = -1 / L
+    A[:, 1, 0] = 1 / C
+    B = np.zeros((P, 2, 1))
+    B[:, 0, 0] = 1 / L
+    C_out = np.array([[[1.0, 0.0]]])
+    D = np.zeros((1, 1, 1))
+    return A, B, C_out, D
@@ -1,18 +1,22 @@
 import numpy as np
 import matplotlib.pylab as plt
 from scipy import ndimage
+
+from convolution import convolve
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
 
-t = np.linspace(-2,2,400)
+# 取奇数个点使 t=0 落在网格上，'same' 模式的卷积结果与 t 对齐
+t = np.linspace(-2,2,401)
+dt = t[1]-t[0]
 R = np.heaviside(t+0.5,1)-np.heaviside(t-0.5,1)
 
 # 直接通过参数平移创建函数，避免使用ndimage.shift
 r1 = np.heaviside(t-1.5+0.5,1)-np.heaviside(t-1.5-0.5,1)  # 右移1.5
 r2 = np.heaviside(t+0.25+0.5,1)-np.heaviside(t+0.25-0.5,1)  # 左移0.25
 
-g=np.piecewise(t,[t<=-1,(t<0) & (t>-1),(t<1) & (t>=0),t>=1],
-               [0,lambda t:1+t,lambda t:1-t,0])
+# Λ = Π*Π，一次卷积得到所有平移量下的重叠面积
+g = convolve(R, R, dt, mode='same')
 
 plt.subplot(2,2,1)
 plt.title('$\Pi$函数')
@@ -0,0 +1,171 @@
+import time
+
+import numpy as np
+from scipy.fft import next_fast_len, rfft, irfft, fft, ifft
+
+# 采样信号的连续时间卷积：按输入长度自动选择直接卷积、FFT 或 overlap-save
+
+DIRECT_MAX_TAPS = 32        # 较短序列不超过此长度时直接卷积
+DIRECT_MAX_WORK = 2**16     # 或乘加次数 n*m 不超过此值时直接卷积
+OVERLAP_SAVE_RATIO = 8      # 长短序列之比超过此值时用 overlap-save
+
+def choose_method(n, m):
+    """根据两个序列的长度选择卷积方法"""
+    short, long = sorted((n, m))
+    if short <= DIRECT_MAX_TAPS or n * m <= DIRECT_MAX_WORK:
+        return 'direct'
+    if long >= OVERLAP_SAVE_RATIO * short:
+        return 'overlap_save'
+    return 'fft'
+
+def _transforms(complex_input):
+    if complex_input:
+        return fft, lambda X, n: ifft(X, n)
+    return rfft, irfft
+
+def _fft_full(x, h):
+    n = len(x) + len(h) - 1
+    size = next_fast_len(n)
+    forward, inverse = _transforms(np.iscomplexobj(x) or np.iscomplexobj(h))
+    return inverse(forward(x, size) * forward(h, size), size)[:n]
+
+def _overlap_save_full(x, h, block=None):
+    """
+    overlap-save：把长序列 x 切成相互重叠 m-1 点的块，
+    所有块组成二维数组后一次批量 FFT，丢弃每块前 m-1 个受循环卷积影响的点
+    """
+    n, m = len(x), len(h)
+    size = block or next_fast_len(max(8 * m, 1024))
+    step = size - m + 1
+    n_out = n + m - 1
+    n_blocks = -(-n_out // step)
+    padded = np.zeros((n_blocks - 1) * step + size, dtype=np.result_type(x, h))
+    padded[m - 1:m - 1 + n] = x
+    blocks = np.lib.stride_tricks.sliding_window_view(padded, size)[::step]
+    forward, inverse = _transforms(np.iscomplexobj(padded))
+    H = forward(h, size)
+    y = inverse(forward(blocks, size, axis=-1) * H, size)[:, m - 1:]
+    return y.reshape(-1)[:n_out]
+
+def _trim(full, n, m, mode):
+    """按 np.convolve 的约定截取 'full' / 'same' / 'valid' 结果"""
+    if mode == 'full':
+        return full
+    if mode == 'same':
+        start = (min(n, m) - 1) // 2
+        return full[start:start + max(n, m)]
+    if mode == 'valid':
+        return full[min(n, m) - 1:max(n, m)]
+    raise ValueError(f"未知的卷积模式: {mode}")
+
+def convolve(x, h, dt=1.0, mode='full', method='auto'):
+    """
+    连续时间卷积 (x*h)(t) = int x(s) h(t-s) ds 的离散近似:
+    y[n] = dt * sum_k x[k] h[n-k]
+    x、h 为同一间隔 dt 的采样；若 x 从 a、h 从 b 开始，'full' 结果从 a+b 开始
+    method 为 'auto' 时由 choose_method 根据长度选择
+    """
+    x = np.asarray(x)
+    h = np.asarray(h)
+    if x.ndim != 1 or h.ndim != 1 or len(x) == 0 or len(h) == 0:
+        raise ValueError("x 与 h 必须是非空一维数组")
+    if method == 'auto':
+        method = choose_method(len(x), len(h))
+    if method == 'direct':
+        full = np.convolve(x, h, mode='full')
+    elif method == 'fft':
+        full = _fft_full(x, h)
+    elif method == 'overlap_save':
+        # 以较短的序列作为滤波核
+        full = _overlap_save_full(x, h) if len(x) >= len(h) else _overlap_save_full(h, x)
+    else:
+        raise ValueError(f"未知的卷积方法: {method}")
+    return dt * _trim(full, len(x), len(h), mode)
+
+class StreamingConvolver:
+    """
+    分块流式卷积（overlap-save），适用于远长于内存的信号
+    保存上一块末尾 m-1 个输入样本作为重叠部分；只有输入帧与滤波核频谱是预先分配并重复使用的，
+    scipy.fft 不接受 out 参数，每帧的 rfft 与 irfft 各新分配一个数组（频谱原地乘以核频谱，
+    输出直接取 irfft 结果的切片，不再额外复制），内存只与块长和核长有关；
+    输出拼接起来等于 convolve(x, h, dt, mode='full')，输入为空时不产生任何输出
+
+    conv = StreamingConvolver(h, dt)
+    for y in conv.stream(blocks): ...
+    print(conv.samples_per_second)
+    """
+
+    def __init__(self, h, dt=1.0, block_size=None):
+        h = np.asarray(h, dtype=float)
+        if h.ndim != 1 or len(h) == 0:
+            raise ValueError("h 必须是非空一维数组")
+        self.m = len(h)
+        self.dt = dt
+        self.fft_size = next_fast_len(max(block_size or 8 * self.m, 2 * self.m))
+        self.step = self.fft_size - self.m + 1
+        self._H = rfft(h, self.fft_size)
+        self._frame = np.zeros(self.fft_size)
+        self._fill = self.m - 1
+        self._pushed = 0  # 上次 flush 以来送入的样本数
+        self.samples = 0
+        self.elapsed = 0.0
+
+    @property
+    def samples_per_second(self):
+        """已处理输入样本的吞吐量"""
+        return self.samples / self.elapsed if self.elapsed > 0 else float('nan')
+
+    def _run_frame(self):
+        """对当前帧做一次循环卷积，返回其中不受回绕影响的 step 个输出"""
+        X = rfft(self._frame)
+        X *= self._H
+        y = irfft(X, self.fft_size, overwrite_x=True)[self.m - 1:]
+        y *= self.dt
+        return y
+
+    def process(self, x):
+        """送入一块输入，返回目前已能确定的输出（长度为 step 的整数倍，可能为空）"""
+        start = time.perf_counter()
+        x = np.asarray(x, dtype=float).reshape(-1)
+        out = []
+        i = 0
+        while i < len(x):
+            k = min(self.fft_size - self._fill, len(x) - i)
+            self._frame[self._fill:self._fill + k] = x[i:i + k]
+            self._fill += k
+            i += k
+            if self._fill == self.fft_size:
+                out.append(self._run_frame())
+                # 末尾 m-1 个样本留作下一帧的重叠部分
+                self._frame[:self.m - 1] = self._frame[self.step:]
+                self._fill = self.m - 1
+        self.samples += len(x)
+        self._pushed += len(x)
+        self.elapsed += time.perf_counter() - start
+        return np.concatenate(out) if out else np.empty(0)
+
+    def flush(self):
+        """输入结束：补 m-1 个零送出卷积尾部，并输出帧中剩余的样本；未送入任何样本时返回空数组"""
+        if self._pushed == 0:
+            return np.empty(0)
+        tail = self.process(np.zeros(self.m - 1))
+        self.samples -= self.m - 1
+        start = time.perf_counter()
+        pending = self._fill - (self.m - 1)
+        self._frame[self._fill:] = 0
+        rest = self._run_frame()[:pending]
+        self._fill = self.m - 1
+        self._frame[:] = 0
+        self._pushed = 0
+        self.elapsed += time.perf_counter() - start
+        return np.concatenate([tail, rest])
+
+    def stream(self, blocks):
+        """逐块处理输入迭代器，产生非空的输出块，最后送出卷积尾部"""
+        for block in blocks:
+            y = self.process(block)
+            if len(y):
+                yield y
+        y = self.flush()
+        if len(y):
+            yield y
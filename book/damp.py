@@ -1,30 +1,23 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from circuits import rlc_step_current
+
 plt.rcParams['font.sans-serif'] = ['SimSun']
 plt.rcParams['axes.unicode_minus'] = False
 
 
 t = np.linspace(0, 15, 1000)
 L, C, E = 1.0, 1.0, 1.0
-Rs = [3.0, 2.0, 1.0] # Over, Critical, Under
+Rs = np.array([3.0, 2.0, 1.0]) # Over, Critical, Under
 titles = ['过阻尼', '临界阻尼', '欠阻尼']
 
 fig, axes = plt.subplots(1, 3, figsize=(12, 4))
 
-for i, R in enumerate(Rs):
-    if R**2 > 4*L/C: # Overdamped
-        d = np.sqrt(R**2 - 4*L/C)
-        r1, r2 = (-R + d)/(2*L), (-R - d)/(2*L)
-        it = (E/(L*(r1-r2))) * (np.exp(r1*t) - np.exp(r2*t))
-    elif R**2 == 4*L/C: # Critical
-        r = -R/(2*L)
-        it = (E/L) * t * np.exp(r*t)
-    else: # Underdamped
-        alpha = -R/(2*L)
-        beta = np.sqrt(4*L/C - R**2)/(2*L)
-        it = (E/(L*beta)) * np.exp(alpha*t) * np.sin(beta*t)
-        
+# 三种阻尼情形由同一个表达式逐元素给出，一次算出全部曲线
+currents = rlc_step_current(t, Rs[:, None], L, C, E)
+
+for i, it in enumerate(currents):
     axes[i].plot(t, it)
     axes[i].set_title(titles[i])
     axes[i].set_xlabel('t')
@@ -0,0 +1,34 @@
+import numpy as np
+from scipy.fft import fft, ifft, fftfreq
+
+# 色散传播的数值核心，供 sesan.py 等绘图脚本调用
+
+class DispersionPropagator:
+    """
+    色散介质中的脉冲传播：相位随频率平方变化
+    H(f) = exp(1j * factor * f^2 * N * scale)
+
+    初始波形只做一次 FFT，频率轴和相位核 f^2 * N * scale 预先算好并缓存，
+    之后对一组色散系数用一次二维逆 FFT 批量得到各自的时域波形
+    """
+
+    def __init__(self, wave_t, dt, scale=0.001, workers=-1):
+        wave_t = np.asarray(wave_t)
+        n = wave_t.shape[-1]
+        self.dt = dt
+        self.workers = workers
+        self.wave_f = fft(wave_t, workers=workers)
+        self.freq = fftfreq(n, dt)
+        self.phase = self.freq**2 * n * scale
+
+    def spectrum(self, dispersion_factors):
+        """色散后的频谱，形状为 dispersion_factors.shape + (N,)"""
+        factors = np.asarray(dispersion_factors, dtype=float)
+        return self.wave_f * np.exp(1j * factors[..., None] * self.phase)
+
+    def propagate(self, dispersion_factors):
+        """
+        对每个色散系数求时域波形（取实部），标量输入返回一维数组，
+        数组输入在最后一维上批量逆变换
+        """
+        return np.real(ifft(self.spectrum(dispersion_factors), axis=-1, workers=self.workers))
@@ -1,15 +1,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from filters import ideal_masks
+
 # 频率范围
 w = np.linspace(-np.pi, np.pi, 1000)
 ymin, ymax = -0.2, 1.2  # 统一y轴范围
 
-# 低通滤波器系统函数（理想）
-H_low = np.where(np.abs(w) <= np.pi/3, 1, 0)
-H_high = 1 - H_low  # 互补
-H_band = np.where((np.abs(w) >= np.pi/3) & (np.abs(w) <= 2*np.pi/3), 1, 0)
-H_stop = 1 - H_band  # 互补
+# 理想低通、高通、带通、带阻滤波器系统函数，高通与带阻分别与低通、带通互补
+H_low, H_high, H_band, H_stop = ideal_masks(w, cutoff=np.pi/3, band=(np.pi/3, 2*np.pi/3))
 
 plt.figure(figsize=(12, 8))
 
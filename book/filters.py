@@ -0,0 +1,95 @@
+from functools import lru_cache
+
+import numpy as np
+from scipy.fft import rfft, irfft
+from scipy.signal import get_window
+
+from convolution import convolve
+
+# 理想低通、高通、带通、带阻滤波器（filter_system_functions.py 中的系统函数）
+# 及由它们加窗截断得到的 FIR 滤波器
+
+BANDS = ('low', 'high', 'band', 'stop')
+
+def ideal_masks(w, cutoff=np.pi / 3, band=(np.pi / 3, 2 * np.pi / 3)):
+    """
+    数字频率 w 处的理想系统函数，按 BANDS 的顺序返回形状 (4, len(w)) 的数组
+    高通与带阻分别是低通与带通的互补: H_high = 1 - H_low, H_stop = 1 - H_band
+    """
+    aw = np.abs(np.asarray(w, dtype=float))
+    H = np.empty((4,) + aw.shape)
+    H[0] = aw <= cutoff
+    H[2] = (aw >= band[0]) & (aw <= band[1])
+    H[1] = 1 - H[0]
+    H[3] = 1 - H[2]
+    return H
+
+def filter_bank(x, cutoff=np.pi / 3, band=(np.pi / 3, 2 * np.pi / 3)):
+    """
+    用理想滤波器组同时滤波一批实信号 x（沿最后一维），
+    返回形状 (4, *x.shape) 的连续数组，第一维按 BANDS 的顺序
+
+    整批信号只做一次 rfft；低通与带通两个掩模一起做一次批量 irfft，
+    高通与带阻由互补关系 high = x - low, stop = x - band 直接得到
+    """
+    x = np.asarray(x, dtype=float)
+    N = x.shape[-1]
+    w = 2 * np.pi * np.arange(N // 2 + 1) / N
+    masks = ideal_masks(w, cutoff, band)[[0, 2]]
+    X = rfft(x, axis=-1)
+    low_band = irfft(X[None] * masks.reshape((2,) + (1,) * (x.ndim - 1) + (-1,)), N, axis=-1)
+
+    out = np.empty((4,) + x.shape)
+    out[0] = low_band[0]
+    out[2] = low_band[1]
+    np.subtract(x, out[0], out=out[1])
+    np.subtract(x, out[2], out=out[3])
+    return out
+
+@lru_cache(maxsize=128)
+def _design_fir(kind, numtaps, cutoff, band, window):
+    n = np.arange(numtaps) - (numtaps - 1) / 2
+    # 理想低通的单位冲激响应 h[n] = (wc/pi) sinc(wc n / pi)
+    def lowpass(wc):
+        return wc / np.pi * np.sinc(wc * n / np.pi)
+    delta = (n == 0).astype(float)
+    if kind == 'low':
+        h = lowpass(cutoff)
+    elif kind == 'high':
+        h = delta - lowpass(cutoff)
+    elif kind == 'band':
+        h = lowpass(band[1]) - lowpass(band[0])
+    else:
+        h = delta - (lowpass(band[1]) - lowpass(band[0]))
+    h *= get_window(window, numtaps, fftbins=False)
+    h.flags.writeable = False
+    return h
+
+def design_fir(kind, numtaps, cutoff=np.pi / 3, band=(np.pi / 3, 2 * np.pi / 3), window='hamming'):
+    """
+    加窗 sinc 法设计线性相位 FIR 滤波器：截取理想系统函数的单位冲激响应并乘以窗函数
+    kind 取 BANDS 之一；高通与带阻含 delta[n]，要求 numtaps 为奇数
+    按 (kind, numtaps, cutoff, band, window) 缓存最近 128 组设计，返回只读数组
+    """
+    if kind not in BANDS:
+        raise ValueError(f"未知的滤波器类型: {kind}")
+    numtaps = int(numtaps)
+    if numtaps < 1:
+        raise ValueError("numtaps 必须为正整数")
+    if kind in ('high', 'stop') and numtaps % 2 == 0:
+        raise ValueError("高通与带阻滤波器的 numtaps 必须为奇数")
+    if isinstance(window, list):
+        window = tuple(window)
+    return _design_fir(kind, numtaps, float(cutoff), (float(band[0]), float(band[1])), window)
+
+def fir_filter(x, kind, numtaps, cutoff=np.pi / 3, band=(np.pi / 3, 2 * np.pi / 3),
+               window='hamming', method='auto'):
+    """
+    用 design_fir 设计（或取缓存）的滤波器对一维信号 x 滤波，输出与 x 等长，奇数抽头时与 x 对齐（无群延迟）
+    method 为 'auto' 时由 convolution.choose_method 按抽头数选择直接卷积或 FFT 卷积
+    """
+    h = design_fir(kind, numtaps, cutoff, band, window)
+    x = np.asarray(x)
+    # 从 'full' 结果中取与 x 对齐的 len(x) 个点；x 比滤波器短时 mode='same' 会返回 numtaps 个点
+    start = (len(h) - 1) // 2
+    return convolve(x, h, mode='full', method=method)[start:start + len(x)]
@@ -11,18 +11,49 @@ def square_wave(x):
     # 如果在 [0, pi) 范围内则为 1，否则为 -1
     return np.where(x % (2 * np.pi) < np.pi, 1, -1)
 
+def _odd_sines(x, N):
+    """
+    依次产生 sin(x), sin(3x), ..., sin((2N-1)x)（x 为一维数组，产生的数组会被原地复用）
+    sin(n*x)、cos(n*x) 通过旋转递推得到，每项只需乘加:
+    sin((n+2)x) = sin(nx)cos(2x) + cos(nx)sin(2x)
+    cos((n+2)x) = cos(nx)cos(2x) - sin(nx)sin(2x)
+    """
+    sin_n, cos_n = np.sin(x), np.cos(x)  # n = 1
+    sin_2, cos_2 = 2 * sin_n * cos_n, cos_n**2 - sin_n**2
+    tmp = np.empty_like(x)
+    for _ in range(N):
+        yield sin_n
+        # sin_n, cos_n 旋转 2x，原地更新避免临时数组
+        np.multiply(sin_n, cos_2, out=tmp)
+        tmp += cos_n * sin_2
+        cos_n *= cos_2
+        cos_n -= sin_n * sin_2
+        sin_n, tmp = tmp, sin_n
+
+def fourier_series_partial_sums(x, N):
+    """
+    依次产生方波傅里叶级数的部分和 S_1, S_2, ..., S_N
+    S_k(x) = (4/pi) * sum_{j=1}^{k} (1/(2j-1)) * sin((2j-1)*x)
+    """
+    shape = np.shape(x)
+    x = np.atleast_1d(np.asarray(x, dtype=float))
+    result = np.zeros_like(x)
+    for k, sin_n in enumerate(_odd_sines(x, N), start=1):
+        result += sin_n / (2 * k - 1)
+        yield ((4 / np.pi) * result).reshape(shape)[()]
+
 def fourier_series_sum(x, N):
     """
     计算方波的傅里叶级数部分和
     f(x) = (4/pi) * sum_{n=1, 3, ..., 2N-1} (1/n) * sin(n*x)
     这里 N 代表取前 N 个非零项（即奇数项）
     """
+    shape = np.shape(x)
+    x = np.atleast_1d(np.asarray(x, dtype=float))
     result = np.zeros_like(x)
-    # 累加前 N 个奇数项: k=1 对应 n=1, k=2 对应 n=3, ...
-    for k in range(1, N + 1):
-        n = 2 * k - 1
-        result += (1 / n) * np.sin(n * x)
-    return (4 / np.pi) * result
+    for k, sin_n in enumerate(_odd_sines(x, N), start=1):
+        result += sin_n / (2 * k - 1)
+    return ((4 / np.pi) * result).reshape(shape)[()]
 
 def plot_gibbs_phenomenon():
     # 设置中文字体，防止乱码
@@ -39,12 +70,15 @@ def plot_gibbs_phenomenon():
     fig, axes = plt.subplots(2, 2, figsize=(12, 8))
     # fig.suptitle('Gibbs Phenomenon with Different Partial Sums', fontsize=16)
 
+    # 一次递推得到所有部分和，只保留需要展示的几项
+    partial_sums = {N: S for N, S in enumerate(fourier_series_partial_sums(x, max(Ns)), start=1) if N in Ns}
+
     for i, N in enumerate(Ns):
         row = i // 2
         col = i % 2
         ax = axes[row, col]
         
-        y_approx = fourier_series_sum(x, N)
+        y_approx = partial_sums[N]
         
         # 绘制原信号（虚线）
         ax.plot(x, y_exact, 'k--', linewidth=1, alpha=0.5, label='原信号')
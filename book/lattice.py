@@ -0,0 +1,186 @@
+from collections import namedtuple
+
+import numpy as np
+
+# 格点的几何计算：基约化、窗口内格点枚举以及格采样与重建
+# 格 L = { A k | k 为整数向量 }，基向量为矩阵 A 的列
+
+def lll_reduce(A, delta=0.75):
+    """
+    LLL 基约化（对 A 的列），返回生成同一个格的较短、较正交的基
+    二维时等价于高斯（拉格朗日）约化
+    """
+    B = np.array(A, dtype=float, copy=True)
+    n = B.shape[1]
+    if np.linalg.matrix_rank(B) < n:
+        raise ValueError("基向量线性相关，无法约化")
+
+    def gram_schmidt(B):
+        Q = np.zeros_like(B)
+        mu = np.zeros((n, n))
+        for i in range(n):
+            Q[:, i] = B[:, i]
+            for j in range(i):
+                mu[i, j] = B[:, i] @ Q[:, j] / (Q[:, j] @ Q[:, j])
+                Q[:, i] -= mu[i, j] * Q[:, j]
+        return Q, mu
+
+    Q, mu = gram_schmidt(B)
+    k = 1
+    while k < n:
+        for j in range(k - 1, -1, -1):
+            q = np.round(mu[k, j])
+            if q != 0:
+                B[:, k] -= q * B[:, j]
+                Q, mu = gram_schmidt(B)
+        if Q[:, k] @ Q[:, k] >= (delta - mu[k, k - 1]**2) * (Q[:, k - 1] @ Q[:, k - 1]):
+            k += 1
+        else:
+            B[:, [k - 1, k]] = B[:, [k, k - 1]]
+            Q, mu = gram_schmidt(B)
+            k = max(k - 1, 1)
+    return B
+
+def _row_ranges(A, lo, hi, tol=1e-9):
+    """
+    逐行（固定 k2）求出使 k1*a1 + k2*a2 落在 [lo, hi] 内的 k1 整数区间
+    k2 的范围由窗口四角在对偶方向 A^{-1} 第二行上的投影确定
+    """
+    a1, a2 = A[:, 0], A[:, 1]
+    corners = np.array([[lo[0], lo[1]], [hi[0], lo[1]], [lo[0], hi[1]], [hi[0], hi[1]]])
+    k2_proj = corners @ np.linalg.inv(A)[1]
+    k2 = np.arange(np.ceil(k2_proj.min() - tol), np.floor(k2_proj.max() + tol) + 1)
+
+    k1_lo = np.full(k2.shape, -np.inf)
+    k1_hi = np.full(k2.shape, np.inf)
+    for d in range(2):
+        offset = k2 * a2[d]
+        if a1[d] == 0:
+            outside = (offset < lo[d] - tol) | (offset > hi[d] + tol)
+            k1_lo[outside] = np.inf
+            continue
+        b1 = (lo[d] - offset) / a1[d]
+        b2 = (hi[d] - offset) / a1[d]
+        k1_lo = np.maximum(k1_lo, np.minimum(b1, b2))
+        k1_hi = np.minimum(k1_hi, np.maximum(b1, b2))
+    k1_lo = np.ceil(k1_lo - tol)
+    k1_hi = np.floor(k1_hi + tol)
+    counts = np.where(k1_hi >= k1_lo, k1_hi - k1_lo + 1, 0).astype(np.int64)
+    keep = counts > 0
+    return k2[keep], k1_lo[keep], counts[keep]
+
+def iter_lattice_points(A, lo, hi, reduce=True, max_points=2**20):
+    """
+    按行枚举二维格 A 落在矩形窗口 [lo, hi] 内的所有格点，
+    每次产生不超过约 max_points 个点的 (k, 2) 坐标数组，不生成窗口外的点
+    reduce=True 时先做 LLL 约化，斜交严重的基也不会产生大量空行
+    """
+    A = np.asarray(A, dtype=float)
+    if A.shape != (2, 2):
+        raise ValueError("A 必须是 2x2 矩阵")
+    if reduce:
+        A = lll_reduce(A)
+    lo = np.broadcast_to(np.asarray(lo, dtype=float), (2,))
+    hi = np.broadcast_to(np.asarray(hi, dtype=float), (2,))
+    k2, k1_lo, counts = _row_ranges(A, lo, hi)
+
+    # 按累计点数把行分组，每组一次性展开
+    ends = np.cumsum(counts)
+    start_row = 0
+    while start_row < len(k2):
+        base = ends[start_row - 1] if start_row else 0
+        stop_row = max(start_row + 1, int(np.searchsorted(ends, base + max_points, side='right')))
+        rows = slice(start_row, stop_row)
+        c = counts[rows]
+        row_start = np.repeat(np.cumsum(c) - c, c)
+        k1 = np.repeat(k1_lo[rows], c) + (np.arange(c.sum()) - row_start)
+        k2_rep = np.repeat(k2[rows], c)
+        yield np.outer(k1, A[:, 0]) + np.outer(k2_rep, A[:, 1])
+        start_row = stop_row
+
+def lattice_points(A, lo, hi, reduce=True):
+    """二维格 A 落在矩形窗口 [lo, hi] 内的全部格点，形状 (k, 2)"""
+    chunks = list(iter_lattice_points(A, lo, hi, reduce))
+    return np.concatenate(chunks) if chunks else np.empty((0, 2))
+
+LatticeReconstruction = namedtuple('LatticeReconstruction', [
+    'x', 'y',                   # 细网格的空间坐标
+    'original',                 # 细网格上的原函数
+    'samples',                  # 格点上的采样值，第 (i, j) 个位于 A^{-T} (i - K/2, j - K/2)
+    'reconstructed',            # 用胞腔指示函数重建的函数
+    'xi_x', 'xi_y',             # 一个周期内频率点的坐标 A eta，eta 取遍 [-1/2, 1/2)^2
+    'periodized_spectrum',      # 周期化频谱在这些频率点上的取值
+    'alias_error',              # 重建的相对 L2 误差
+    'density',                  # 单位面积内的采样点数 |det A|
+])
+
+def _cell_mask(A, eta1, eta2, cell):
+    """
+    频率 xi = A eta 是否落在以原点为中心的基本胞腔内
+    'parallelogram' 为 A[-1/2, 1/2)^2，'voronoi' 为离原点比离其他格点更近的区域
+    """
+    if cell == 'parallelogram':
+        return (eta1 >= -0.5) & (eta1 < 0.5) & (eta2 >= -0.5) & (eta2 < 0.5)
+    if cell != 'voronoi':
+        raise ValueError(f"未知的胞腔: {cell}")
+    # 约化基下 Voronoi 胞腔只由最近的几个格点决定；边界上的点只归入一侧，保证胞腔恰好铺满平面
+    B = lll_reduce(A)
+    C = np.linalg.solve(B, A)
+    e1 = C[0, 0] * eta1 + C[0, 1] * eta2
+    e2 = C[1, 0] * eta1 + C[1, 1] * eta2
+    G = B.T @ B
+    mask = np.ones(eta1.shape, dtype=bool)
+    for m in ((1, 0), (0, 1), (1, 1), (1, -1)):
+        m = np.array(m)
+        # |xi|^2 与 |xi -+ B m|^2 比较，化为 xi . B m 与 |B m|^2 / 2 比较
+        proj = (G @ m)[0] * e1 + (G @ m)[1] * e2
+        half = m @ G @ m / 2
+        mask &= (proj <= half) & (proj > -half)
+    return mask
+
+def sample_and_reconstruct(f, A, n_samples=256, upsample=8, cell='parallelogram'):
+    """
+    在采样格 A^{-T} Z^2 上对 f(x, y) 采样，频谱以倒格 A Z^2 为周期周期化，
+    再乘以基本胞腔的指示函数重建（即 lattice_sample.py 中的两幅图）
+
+    换元 u = A^T x 后采样点变为整数格 Z^2，频率 eta = A^{-1} xi 的周期变为 1，
+    采样、周期化与重建都化为矩形网格上的二维 FFT：
+    - 细网格取 u 的步长 1/upsample，共 (n_samples*upsample)^2 个点，作为"连续"函数
+    - 采样序列的 DFT 就是周期化频谱在一个周期内的取值，平铺即得细网格上的周期化频谱
+    - 乘以胞腔指示函数再逆变换即为重建；cell 可取 'parallelogram' 或 'voronoi'
+    f 可以返回形状为 (..., n, n) 的一批函数，所有 FFT 沿最后两维批量进行
+    """
+    A = np.asarray(A, dtype=float)
+    if A.shape != (2, 2):
+        raise ValueError("A 必须是 2x2 矩阵")
+    if n_samples % 2:
+        raise ValueError("n_samples 必须是偶数")
+    S = np.linalg.inv(A).T
+    K, L = n_samples, upsample
+    n = K * L
+
+    # 细网格在 u 坐标下等间隔，并包含所有整数点（采样点）
+    u = (np.arange(n) - n // 2) / L
+    U1, U2 = np.meshgrid(u, u, indexing='ij')
+    x = S[0, 0] * U1 + S[0, 1] * U2
+    y = S[1, 0] * U1 + S[1, 1] * U2
+    original = np.asarray(f(x, y), dtype=float)
+    samples = original[..., ::L, ::L]
+
+    # 采样序列的 DFT（FFT 顺序下第 j 个频点为 eta = j/K），以周期 1 平铺到细网格
+    spectrum = np.fft.fft2(samples)
+    eta = np.fft.fftfreq(n, d=1 / L)
+    E1, E2 = np.meshgrid(eta, eta, indexing='ij')
+    periodized = np.tile(spectrum, (L, L))
+    periodized *= _cell_mask(A, E1, E2, cell)
+    reconstructed = np.fft.ifft2(periodized).real * L**2
+
+    error = np.sqrt(np.sum((reconstructed - original)**2, axis=(-2, -1)) /
+                    np.sum(original**2, axis=(-2, -1)))
+    eta = (np.arange(K) - K // 2) / K
+    E1, E2 = np.meshgrid(eta, eta, indexing='ij')
+    density = abs(np.linalg.det(A))
+    return LatticeReconstruction(x, y, original, samples, reconstructed,
+                                 A[0, 0] * E1 + A[0, 1] * E2, A[1, 0] * E1 + A[1, 1] * E2,
+                                 np.fft.fftshift(spectrum, axes=(-2, -1)) / density,
+                                 error, density)
@@ -2,6 +2,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Polygon
 
+from lattice import lattice_points
+
 # 设置图形
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
 
@@ -23,23 +25,14 @@ A_inv_T = np.linalg.inv(A).T
 u_star_1 = A_inv_T[:, 0]
 u_star_2 = A_inv_T[:, 1]
 
-# 生成网格点
-k_range = 5
-k_vals = np.arange(-k_range, k_range + 1)
-K1, K2 = np.meshgrid(k_vals, k_vals)
-K1_flat = K1.flatten()
-K2_flat = K2.flatten()
-
-# 计算采样点坐标: x = k1 * u_star_1 + k2 * u_star_2
-X_samples = K1_flat * u_star_1[0] + K2_flat * u_star_2[0]
-Y_samples = K1_flat * u_star_1[1] + K2_flat * u_star_2[1]
-
 # 设置显示范围
 limit_left = 3.5
-mask = (np.abs(X_samples) < limit_left + 0.5) & (np.abs(Y_samples) < limit_left + 0.5)
+
+# 只枚举显示窗口内的采样点: x = k1 * u_star_1 + k2 * u_star_2
+samples = lattice_points(A_inv_T, -limit_left, limit_left)
 
 # 绘制采样点
-ax1.scatter(X_samples[mask], Y_samples[mask], color='black', s=15, zorder=5)
+ax1.scatter(samples[:, 0], samples[:, 1], color='black', s=15, zorder=5)
 
 # 画坐标轴 (不标注)
 ax1.plot([-limit_left, limit_left], [0, 0], 'k-', lw=1, zorder=1)
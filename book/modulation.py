@@ -0,0 +1,149 @@
+import time
+from functools import lru_cache
+
+import numpy as np
+from scipy.fft import fft, ifft
+from scipy.signal import butter, sosfilt, sosfilt_zi
+
+# 分块流式的双边带调幅（DSB）与相干解调，内存只与块长有关
+#   调制: s(t) = (A0 + m(t)) cos(2 pi fc t + phi)
+#   解调: m(t) = LPF{ 2 s(t) cos(2 pi fc t + phi) } - A0
+# 以及基于解析信号（FFT 希尔伯特变换）的包络与瞬时频率提取
+
+class Oscillator:
+    """
+    相位累加载波发生器：跨块保存相位并对 2pi 取模，长时间运行不损失精度
+    每 block 个样本只在块首计算一次 cos/sin，块内用预先算好的旋转表
+    cos(phi + k*step) = cos(phi) cos(k*step) - sin(phi) sin(k*step) 展开
+    """
+
+    def __init__(self, fc, fs, phase=0.0, block=4096):
+        self.step = 2 * np.pi * fc / fs
+        self.phase = phase % (2 * np.pi)
+        self.block = block
+        k = np.arange(block) * self.step
+        self._cos = np.cos(k)
+        self._sin = np.sin(k)
+
+    def __call__(self, n):
+        """返回接下来 n 个样本的 cos(相位)，并把相位推进 n 步"""
+        B = self.block
+        nb = -(-n // B)
+        heads = self.phase + np.arange(nb) * (B * self.step)
+        out = np.multiply.outer(np.cos(heads), self._cos)
+        out -= np.multiply.outer(np.sin(heads), self._sin)
+        self.phase = (self.phase + n * self.step) % (2 * np.pi)
+        return out.reshape(-1)[:n]
+
+class _Throughput:
+    """记录已处理样本数与耗时"""
+    samples = 0
+    elapsed = 0.0
+
+    @property
+    def samples_per_second(self):
+        """已处理样本的吞吐量"""
+        return self.samples / self.elapsed if self.elapsed > 0 else float('nan')
+
+class AMModulator(_Throughput):
+    """
+    mod = AMModulator(fc, fs)
+    for m in chunks: s = mod.process(m)
+    carrier_level 为 A0，取 0 时即 AM.py 中的抑制载波双边带信号
+    """
+
+    def __init__(self, fc, fs, carrier_level=0.0, phase=0.0):
+        self.carrier = Oscillator(fc, fs, phase)
+        self.carrier_level = carrier_level
+
+    def process(self, m):
+        start = time.perf_counter()
+        m = np.asarray(m, dtype=float)
+        s = self.carrier(len(m))
+        s *= m + self.carrier_level if self.carrier_level else m
+        self.samples += len(m)
+        self.elapsed += time.perf_counter() - start
+        return s
+
+class CoherentDemodulator(_Throughput):
+    """
+    相干解调：与同频同相的本地载波相乘，再经 Butterworth 低通滤除 2fc 分量
+    低通以二阶节级联实现，滤波器状态跨块保存，分块输出拼接后与整段处理完全一致
+    """
+
+    def __init__(self, fc, fs, cutoff, order=4, carrier_level=0.0, phase=0.0):
+        if not 0 < cutoff < fs / 2:
+            raise ValueError("截止频率必须位于 (0, fs/2) 内")
+        self.carrier = Oscillator(fc, fs, phase)
+        self.carrier_level = carrier_level
+        self.sos = butter(order, cutoff, fs=fs, output='sos')
+        self.zi = np.zeros((len(self.sos), 2))
+
+    def reset(self, x0=0.0):
+        """清除滤波器状态；x0 非零时按输入恒为 x0 的稳态初始化"""
+        self.zi = sosfilt_zi(self.sos) * x0
+
+    def process(self, s):
+        start = time.perf_counter()
+        s = np.asarray(s, dtype=float)
+        mixed = self.carrier(len(s))
+        mixed *= s
+        mixed *= 2
+        m, self.zi = sosfilt(self.sos, mixed, zi=self.zi)
+        if self.carrier_level:
+            m -= self.carrier_level
+        self.samples += len(s)
+        self.elapsed += time.perf_counter() - start
+        return m
+
+def am_pipeline(chunks, fc, fs, cutoff, **kwargs):
+    """
+    逐块调制再解调，产生 (已调信号块, 解调信号块)；
+    kwargs 传给 CoherentDemodulator（carrier_level 同时用于调制端）
+    """
+    mod = AMModulator(fc, fs, kwargs.get('carrier_level', 0.0), kwargs.get('phase', 0.0))
+    demod = CoherentDemodulator(fc, fs, cutoff, **kwargs)
+    for m in chunks:
+        s = mod.process(m)
+        yield s, demod.process(s)
+
+@lru_cache(maxsize=32)
+def _analytic_multiplier(n):
+    """解析信号的频域乘子：直流与奈奎斯特频点乘 1，正频率乘 2，负频率置 0"""
+    h = np.zeros(n)
+    h[0] = 1
+    if n % 2 == 0:
+        h[n // 2] = 1
+        h[1:n // 2] = 2
+    else:
+        h[1:(n + 1) // 2] = 2
+    h.flags.writeable = False
+    return h
+
+def analytic_signal(x, axis=-1, workers=-1):
+    """解析信号 x + j H{x}，沿 axis 对一批实信号同时计算，乘子按长度缓存"""
+    x = np.asarray(x, dtype=float)
+    n = x.shape[axis]
+    shape = [1] * x.ndim
+    shape[axis] = n
+    X = fft(x, axis=axis, workers=workers)
+    X *= _analytic_multiplier(n).reshape(shape)
+    return ifft(X, axis=axis, overwrite_x=True, workers=workers)
+
+def envelope(x, fs=1.0, axis=-1):
+    """
+    由解析信号 z = a e^{j phi} 一次求出 (包络 a, 展开后的瞬时相位 phi, 瞬时频率)
+    瞬时频率 fs/(2pi) * angle(z[k] conj(z[k-1]))，无需先展开相位；首点取第二点的值
+    x 可以是二维数组，沿 axis 为时间轴，适合成批分析调幅信号
+    """
+    z = np.moveaxis(analytic_signal(x, axis), axis, -1)
+    amplitude = np.abs(z)
+    dphi = np.angle(z[..., 1:] * np.conj(z[..., :-1]))
+    phase = np.empty(z.shape)
+    phase[..., 0] = np.angle(z[..., 0])
+    np.cumsum(dphi, axis=-1, out=phase[..., 1:])
+    phase[..., 1:] += phase[..., :1]
+    freq = np.empty(z.shape)
+    freq[..., 1:] = dphi * (fs / (2 * np.pi))
+    freq[..., 0] = freq[..., 1] if z.shape[-1] > 1 else 0.0
+    return tuple(np.moveaxis(a, -1, axis) for a in (amplitude, phase, freq))
@@ -2,6 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyArrow
 
+from sampling import line_spectrum, periodize_signal
+
 # 设置中文字体和图形参数
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
@@ -65,16 +67,10 @@ N_periods = 5   # 显示的周期数
 t_extended = np.linspace(-N_periods*T_period/2, N_periods*T_period/2, 
                          int(fs * N_periods * T_period), endpoint=False)
 
-# 创建周期化信号
-periodic_signal = np.zeros_like(t_extended)
-for n in range(-N_periods//2, N_periods//2 + 1):
-    # 将原信号周期延拓
-    periodic_signal += np.interp(t_extended - n * T_period, t, original_signal, 
-                                left=0, right=0)
-
-# 计算周期化信号的频谱
-periodic_spectrum = np.fft.fftshift(np.fft.fft(periodic_signal)) / len(periodic_signal)
-freq_extended = np.fft.fftshift(np.fft.fftfreq(len(t_extended), 1/fs))
+# 创建周期化信号：先把原信号折叠到一个周期内，再按时间在周期内的位置直接取值
+t_period, one_period = periodize_signal(t, original_signal, T_period)
+period_idx = np.round((t_extended - t_period[0]) * fs).astype(int) % len(one_period)
+periodic_signal = one_period[period_idx]
 
 # 绘制周期化信号的时域图
 axes[1, 0].plot(t_extended, periodic_signal, 'r-', linewidth=2, label='周期化信号')
@@ -98,31 +94,29 @@ axes[1, 0].legend()
 axes[1, 0].set_xlim(-2, 2)
 
 # 绘制周期化信号的频谱（用狄拉克箭头）
-# 先用浅色绘制原信号频谱
-axes[1, 1].plot(freq, np.abs(original_spectrum), 'b--', alpha=0.5, 
+# 先用浅色绘制原信号频谱，按 1/T_period 缩放后即为谱线的包络
+axes[1, 1].plot(freq, np.abs(original_spectrum) * T / T_period, 'b--', alpha=0.5, 
                linewidth=1.5, label='原信号频谱')
 
 # 计算狄拉克梳的位置（基频的整数倍）
 f0 = 1 / T_period  # 基频
 max_harmonic = int(15 / f0)  # 显示到15Hz以内的谐波
 
+# 泊松求和：周期化信号的谱线强度 c_n = F(n/T_period) / T_period，按谐波下标直接取出
+harmonic_freqs, harmonic_coeffs = line_spectrum(t, original_signal, T_period, max_harmonic)
+harmonic_mags = np.abs(harmonic_coeffs)
+
 # 用箭头表示狄拉克分布
-for n in range(-max_harmonic, max_harmonic + 1):
-    freq_pos = n * f0
-    if abs(freq_pos) <= 15:  # 只在显示范围内绘制
-        # 找到最接近的频率点的索引
-        idx = np.argmin(np.abs(freq_extended - freq_pos))
-        magnitude = np.abs(periodic_spectrum[idx]) * len(periodic_signal) / len(original_signal)
-        
-        # 绘制箭头 - 增加最小高度确保箭头可见
-        min_height = 0.1  # 最小箭头高度
-        arrow_height = max(magnitude, min_height)
-        
-        # 绘制箭头
-        arrow = FancyArrow(freq_pos, 0, 0, arrow_height, 
-                         width=0.02, head_width=0.05, head_length=0.05,
-                         length_includes_head=True, fc='red', ec='red', alpha=0.8)
-        axes[1, 1].add_patch(arrow)
+for freq_pos, magnitude in zip(harmonic_freqs, harmonic_mags):
+    # 绘制箭头 - 增加最小高度确保箭头可见
+    min_height = 0.1  # 最小箭头高度
+    arrow_height = max(magnitude, min_height)
+    
+    # 绘制箭头
+    arrow = FancyArrow(freq_pos, 0, 0, arrow_height, 
+                     width=0.02, head_width=0.05, head_length=0.05,
+                     length_includes_head=True, fc='red', ec='red', alpha=0.8)
+    axes[1, 1].add_patch(arrow)
 
 # 添加周期化信号频谱的图例（使用红色箭头）
 from matplotlib.lines import Line2D
@@ -145,10 +139,6 @@ plt.show()
 # 打印频谱信息
 print(f"周期化信号的基频: {f0:.2f} Hz")
 print("显著的频率分量:")
-for n in range(0, max_harmonic + 1):
-    freq_pos = n * f0
-    if abs(freq_pos) <= 15:
-        idx = np.argmin(np.abs(freq_extended - freq_pos))
-        magnitude = np.abs(periodic_spectrum[idx]) * len(periodic_signal) / len(original_signal)
-        if magnitude > 0.01:
-            print(f"  {freq_pos:.1f} Hz: 幅度 = {magnitude:.3f}")
\ No newline at end of file
+for freq_pos, magnitude in zip(harmonic_freqs[max_harmonic:], harmonic_mags[max_harmonic:]):
+    if magnitude > 0.01:
+        print(f"  {freq_pos:.1f} Hz: 幅度 = {magnitude:.3f}")
\ No newline at end of file
@@ -0,0 +1,86 @@
+from functools import lru_cache
+
+import numpy as np
+
+# 复平面与黎曼球面之间的球极投影（从北极 (0, 0, 1) 投影到平面 z = 0）
+# 正、反映射都接受整个复数数组，并可写入预分配的 out 缓冲区
+
+def inverse_stereographic(z, out=None):
+    """
+    复平面上的点 z 映射到单位球面，返回形状 (3, *z.shape) 的 (X, Y, Z):
+    X = 2 Re z / (|z|^2 + 1),  Y = 2 Im z / (|z|^2 + 1),  Z = (|z|^2 - 1) / (|z|^2 + 1)
+    |z|^2 与 1/(|z|^2 + 1) 只计算一次；z 为无穷大时映射到北极
+    """
+    z = np.asarray(z, dtype=complex)
+    if out is None:
+        out = np.empty((3,) + z.shape)
+    elif out.shape != (3,) + z.shape:
+        raise ValueError(f"out 的形状应为 {(3,) + z.shape}")
+    scale = np.array(z.real * z.real + z.imag * z.imag + 1)
+    np.divide(2, scale, out=scale)
+    with np.errstate(invalid='ignore'):
+        np.multiply(z.real, scale, out=out[0, ...])
+        np.multiply(z.imag, scale, out=out[1, ...])
+    # Z = 1 - 2/(|z|^2 + 1)，避免再做一次除法
+    np.subtract(1, scale, out=out[2, ...])
+    pole = np.isinf(z)
+    if np.any(pole):
+        out[:, pole] = np.array([0.0, 0.0, 1.0])[:, None]
+    return out
+
+def stereographic(P, out=None):
+    """
+    球面上的点 P = (X, Y, Z)（形状 (3, ...)）映射到复平面: z = (X + jY) / (1 - Z)
+    北半球改用 1 - Z = (X^2 + Y^2) / (1 + Z)，避免在北极附近相消；北极映射到复无穷大
+    """
+    P = np.asarray(P, dtype=float)
+    if P.shape[0] != 3:
+        raise ValueError("P 的第一维必须是 3")
+    if out is None:
+        out = np.empty(P.shape[1:], dtype=complex)
+    elif out.shape != P.shape[1:]:
+        raise ValueError(f"out 的形状应为 {P.shape[1:]}")
+    out.real = P[0]
+    out.imag = P[1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        denom = np.where(P[2] > 0, (P[0]**2 + P[1]**2) / (1 + P[2]), 1 - P[2])
+        out /= denom
+    out[denom == 0] = complex(np.inf, np.inf)
+    return out
+
+@lru_cache(maxsize=8)
+def sphere_mesh(n_u=50, n_v=50):
+    """
+    单位球面的经纬网格，按 (n_u, n_v) 缓存，返回只读的 (xyz, z_plane):
+    xyz 形状 (3, n_u, n_v)，第 i 行为经度 u_i、第 j 列为余纬 v_j；
+    z_plane 为各网格点在复平面上的原像（北极为无穷大），
+    用于把 |H(s)| 等平面上的函数画到球面上而不必每帧重建几何
+    """
+    u = np.linspace(0, 2 * np.pi, n_u)
+    v = np.linspace(0, np.pi, n_v)
+    xyz = np.empty((3, n_u, n_v))
+    np.outer(np.cos(u), np.sin(v), out=xyz[0])
+    np.outer(np.sin(u), np.sin(v), out=xyz[1])
+    xyz[2] = np.cos(v)
+    z_plane = stereographic(xyz)
+    xyz.flags.writeable = False
+    z_plane.flags.writeable = False
+    return xyz, z_plane
+
+def sphere_values(H, n_u=50, n_v=50, pole_radius=1e6):
+    """
+    在缓存的球面网格上求平面函数 H(z) 的值，例如 np.abs(H(s)) 用作球面着色；
+    返回 (xyz, values)
+    北极对应 z = 无穷大，直接代入会得到 nan；改为沿各自经度方向在半径 pole_radius 处求值，
+    即 |z| -> 无穷时 H 的极限（有理函数在无穷远处的极限与方向无关），网格在北极处不留缺口
+    """
+    xyz, z_plane = sphere_mesh(n_u, n_v)
+    pole = np.isinf(z_plane)
+    z = z_plane
+    if np.any(pole):
+        u = np.broadcast_to(np.linspace(0, 2 * np.pi, n_u)[:, None], z_plane.shape)
+        z = z_plane.copy()
+        z[pole] = pole_radius * np.exp(1j * u[pole])
+    with np.errstate(all='ignore'):
+        values = H(z)
+    return xyz, values
@@ -0,0 +1,249 @@
+import numpy as np
+from scipy import signal
+
+# 采样与重建的数值核心，供 alias1.py 等绘图脚本调用
+
+def _uniform_step(x):
+    """若 x 为等间隔网格则返回步长，否则返回 None"""
+    if len(x) < 2:
+        return None
+    step = (x[-1] - x[0]) / (len(x) - 1)
+    if step == 0 or not np.allclose(np.diff(x), step, rtol=1e-6, atol=0):
+        return None
+    return step
+
+def _fft_upsample_factor(t_out, t_samples, fs):
+    """
+    判断能否走 FFT 路径：采样点间隔为 1/fs，输出网格等间隔，
+    且每个采样间隔恰好包含整数个输出点。可以时返回该整数，否则返回 None
+    """
+    ds = _uniform_step(t_samples)
+    dt = _uniform_step(t_out)
+    if ds is None or dt is None or dt <= 0 or not np.isclose(ds * fs, 1.0):
+        return None
+    L = 1.0 / (fs * dt)
+    L_int = int(round(L))
+    if L_int < 1 or abs(L - L_int) > 1e-6 * L:
+        return None
+    return L_int
+
+def _sinc_reconstruct_direct(t_out, t_samples, samples, fs, max_block_bytes):
+    """
+    分块矩阵乘法，把正弦从 (块长, M) 的矩阵中提出来:
+    sin(pi fs (t - t_k)) = sin(pi fs t) cos(pi fs t_k) - cos(pi fs t) sin(pi fs t_k)
+    于是每块只需构造 1/(pi fs (t - t_k)) 并与 (cos, sin) 加权的采样值做一次矩阵乘法，
+    三角函数只对输出点与采样点各算一次；|fs (t - t_k)| < 0.5 的点对（含 t = t_k）
+    两项相消较严重，用排序后的 searchsorted 预先找出，从矩阵中去掉后直接按 sinc 补上
+    """
+    N = len(t_out)
+    y = np.empty(N, dtype=np.result_type(samples, float))
+    # 每块只有一个 (块长, M) 的 float64 矩阵，其余运算都原地进行
+    row_bytes = 8 * max(len(t_samples), 1)
+    block = max(1, int(max_block_bytes // row_bytes))
+    scaled_out = fs * t_out
+    scaled_samples = fs * t_samples
+    # 先对 2 取余（精确运算）再乘 pi，三角函数的参数限制在 [0, 2pi)
+    phase_out = np.pi * np.remainder(scaled_out, 2)
+    phase_samples = np.pi * np.remainder(scaled_samples, 2)
+    sin_out, cos_out = np.sin(phase_out), np.cos(phase_out)
+    weights = np.stack([np.cos(phase_samples) * samples, np.sin(phase_samples) * samples], axis=1)
+
+    # 近邻点对 (rows[p], cols[p])：|fs t - fs t_k| < 0.5，按 rows 升序排列
+    order = np.argsort(scaled_samples, kind='stable')
+    sorted_samples = scaled_samples[order]
+    lo = np.searchsorted(sorted_samples, scaled_out - 0.5, side='right')
+    counts = np.searchsorted(sorted_samples, scaled_out + 0.5, side='left') - lo
+    rows = np.repeat(np.arange(N), counts)
+    first = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+    cols = order[first + np.arange(len(rows))]
+
+    bounds = np.searchsorted(rows, np.arange(0, N + block, block))
+    for b, start in enumerate(range(0, N, block)):
+        stop = min(start + block, N)
+        arg = scaled_out[start:stop, None] - scaled_samples[None, :]
+        pairs = slice(bounds[b], bounds[b + 1])
+        arg[rows[pairs] - start, cols[pairs]] = np.inf
+        arg *= np.pi
+        np.reciprocal(arg, out=arg)
+        P = arg @ weights
+        np.multiply(sin_out[start:stop], P[:, 0], out=y[start:stop])
+        y[start:stop] -= cos_out[start:stop] * P[:, 1]
+    np.add.at(y, rows, samples[cols] * np.sinc(scaled_out[rows] - scaled_samples[cols]))
+    return y
+
+def _sinc_reconstruct_fft(t_out, t_samples, samples, fs, L):
+    """
+    等间隔网格上的重建是补零（每个采样间插入 L-1 个零）序列与
+    h[m] = sinc(m/L + c) 的线性卷积，c = fs*(t_out[0] - t_samples[0])，
+    用零填充 FFT 卷积一次算出
+    """
+    N, M = len(t_out), len(t_samples)
+    c = fs * (t_out[0] - t_samples[0])
+    upsampled = np.zeros((M - 1) * L + 1, dtype=samples.dtype)
+    upsampled[::L] = samples
+    m = np.arange(-(M - 1) * L, N)
+    kernel = np.sinc(m / L + c)
+    full = signal.fftconvolve(upsampled, kernel, mode='full')
+    return full[(M - 1) * L:(M - 1) * L + N]
+
+def sinc_reconstruct(t_out, t_samples, samples, fs, method='auto', max_block_bytes=64 * 2**20):
+    """
+    Whittaker–Shannon 插值重建:
+    x(t) = sum_k x(t_k) * sinc(fs * (t - t_k))
+
+    method:
+        'direct' - 分块矩阵乘法，适用于任意采样点与输出点，
+                   单块内存不超过 max_block_bytes
+        'fft'    - 零填充 FFT 卷积，要求采样间隔为 1/fs、输出网格等间隔
+                   且采样间隔为输出间隔的整数倍
+        'auto'   - 满足 'fft' 条件时用 FFT，否则用 'direct'
+    """
+    t_out = np.asarray(t_out, dtype=float)
+    t_samples = np.asarray(t_samples, dtype=float)
+    samples = np.asarray(samples)
+    if t_samples.shape != samples.shape or t_samples.ndim != 1:
+        raise ValueError("t_samples 与 samples 必须是等长的一维数组")
+    scalar_out = t_out.ndim == 0
+    t_out = np.atleast_1d(t_out)
+    if t_out.ndim != 1:
+        raise ValueError("t_out 必须是一维数组")
+
+    if method not in ('auto', 'direct', 'fft'):
+        raise ValueError(f"未知的重建方法: {method}")
+    L = None if method == 'direct' else _fft_upsample_factor(t_out, t_samples, fs)
+    if method == 'fft' and L is None:
+        raise ValueError("FFT 重建要求采样间隔为 1/fs，且输出网格等间隔并整除采样间隔")
+
+    if len(t_samples) == 0:
+        y = np.zeros(len(t_out))
+    elif L is not None:
+        y = _sinc_reconstruct_fft(t_out, t_samples, samples, fs, L)
+    else:
+        y = _sinc_reconstruct_direct(t_out, t_samples, samples, fs, max_block_bytes)
+    return y[0] if scalar_out else y
+
+def _mask_to_intervals(freq, mask):
+    """把布尔掩码的连续 True 区段转为 (起点, 终点) 频率区间"""
+    diff = np.diff(mask.astype(np.int8))
+    starts = np.where(diff == 1)[0] + 1
+    ends = np.where(diff == -1)[0] + 1
+    if mask[0]:
+        starts = np.r_[0, starts]
+    if mask[-1]:
+        ends = np.r_[ends, len(mask)]
+    return np.column_stack([freq[starts], freq[ends - 1]]) if len(starts) else np.empty((0, 2))
+
+def _shifted_copies(spectrum, shift, n_copies):
+    """
+    第 n 个副本 copies[n + n_copies][i] = spectrum(freq[i] + n * fs)，
+    shift = fs / df 为每次平移的频点数，越界处补零
+    """
+    N = len(spectrum)
+    n = np.arange(-n_copies, n_copies + 1)
+    k = int(round(shift))
+    if abs(shift - k) <= 1e-6 * max(abs(shift), 1):
+        # 整数频点平移：在补零数组上按步长 k 取滑动窗口，得到只读视图而不复制数据
+        pad = n_copies * abs(k)
+        padded = np.concatenate([np.zeros(pad, spectrum.dtype), spectrum, np.zeros(pad, spectrum.dtype)])
+        start = pad + n[0] * k
+        step = padded.strides[0]
+        return np.lib.stride_tricks.as_strided(padded[start:], shape=(len(n), N),
+                                               strides=(k * step, step), writeable=False)
+    # 非整数平移：对所有副本一次性做线性插值
+    pos = np.arange(N)[None, :] + n[:, None] * shift
+    i0 = np.clip(np.floor(pos).astype(np.intp), 0, N - 1)
+    w = pos - i0
+    padded = np.append(spectrum, 0)
+    copies = (1 - w) * padded[i0] + w * padded[i0 + 1]
+    copies[(pos < 0) | (pos > N - 1)] = 0
+    return copies
+
+def periodize_spectrum(freq, spectrum, fs, n_copies, rel_threshold=0.05):
+    """
+    以 fs 为周期把等间隔频率网格上的频谱周期化:
+    P(f) = sum_{n=-n_copies}^{n_copies} S(f + n*fs)
+
+    返回 (periodized, copies, alias_intervals):
+        periodized      - 周期化频谱总和
+        copies          - 形状 (2*n_copies+1, len(freq)) 的各副本，
+                          平移为整数个频点时是只读视图
+        alias_intervals - 原频谱与任一平移副本同时超过
+                          rel_threshold * max|S| 的频率区间，形状 (k, 2)
+    """
+    freq = np.asarray(freq, dtype=float)
+    spectrum = np.asarray(spectrum)
+    if freq.shape != spectrum.shape or freq.ndim != 1:
+        raise ValueError("freq 与 spectrum 必须是等长的一维数组")
+    df = _uniform_step(freq)
+    if df is None:
+        raise ValueError("频谱周期化要求频率网格等间隔")
+
+    copies = _shifted_copies(spectrum, fs / df, n_copies)
+    periodized = copies.sum(axis=0)
+
+    magnitude = np.abs(copies)
+    threshold = rel_threshold * np.max(np.abs(spectrum))
+    significant = magnitude > threshold
+    others = np.delete(significant, n_copies, axis=0).any(axis=0)
+    alias_mask = significant[n_copies] & others
+    return periodized, copies, _mask_to_intervals(freq, alias_mask)
+
+def periodize_signal(t, x, T_period):
+    """
+    以 T_period 为周期周期化等间隔采样的信号: x_T(t) = sum_n x(t - n*T_period)
+    要求一个周期恰好包含整数个采样点，按样本所在周期内的位置一次累加
+    返回一个周期内的 (t_period, x_period)，t_period 从 t[0] 开始
+    """
+    t = np.asarray(t, dtype=float)
+    x = np.asarray(x)
+    dt = _uniform_step(t)
+    if dt is None:
+        raise ValueError("周期化要求时间轴等间隔")
+    P = int(round(T_period / dt))
+    if P < 1 or not np.isclose(P * dt, T_period):
+        raise ValueError("周期 T_period 必须是采样间隔的整数倍")
+    idx = np.arange(len(t)) % P
+    if np.iscomplexobj(x):
+        x_period = np.bincount(idx, x.real, P) + 1j * np.bincount(idx, x.imag, P)
+    else:
+        x_period = np.bincount(idx, x, P)
+    return t[0] + np.arange(P) * dt, x_period
+
+def line_spectrum(t, x, T_period, n_harmonics):
+    """
+    周期化信号的线谱（泊松求和公式）:
+    sum_n x(t - n*T) = sum_k c_k * exp(2j*pi*k*t/T),  c_k = X(k/T) / T
+    X(k/T) 由一个周期内的折叠序列做一次 FFT 得到，谐波直接按下标取出
+    返回 (freqs, c)，对应 k = -n_harmonics, ..., n_harmonics
+    """
+    t_period, x_period = periodize_signal(t, x, T_period)
+    P = len(x_period)
+    if 2 * n_harmonics >= P:
+        raise ValueError("谐波数超出一个周期采样点数所能分辨的范围")
+    k = np.arange(-n_harmonics, n_harmonics + 1)
+    X = np.fft.fft(x_period)[k % P]
+    # FFT 以 t_period[0] 为时间原点，乘相位因子换回 t = 0
+    c = X * np.exp(-2j * np.pi * k * t_period[0] / T_period) / P
+    return k / T_period, c
+
+def alias_frequency(f, fs):
+    """
+    以采样率 fs 采样频率为 f 的正弦信号后的视在（基带）频率:
+    f_alias = |f - fs * round(f / fs)|，取值 [0, fs/2]，对任意频带成立
+    f、fs 可为任意可相互广播的数组
+    """
+    f = np.abs(np.asarray(f, dtype=float))
+    fs = np.asarray(fs, dtype=float)
+    if np.any(fs <= 0):
+        raise ValueError("采样率 fs 必须为正")
+    r = np.remainder(f, fs)
+    return np.minimum(r, fs - r)
+
+def aliasing_map(f, fs):
+    """
+    (fs, f) 平面上的混叠图：返回形状 (len(fs), len(f)) 的视在频率，
+    第 i 行对应采样率 fs[i]；一次广播运算得到整幅图
+    """
+    f = np.asarray(f, dtype=float).ravel()
+    fs = np.asarray(fs, dtype=float).ravel()
+    return alias_frequency(f[None, :], fs[:, None])
@@ -0,0 +1,66 @@
+import numpy as np
+
+# 可分离函数 f(x1, ..., xn) = f1(x1) * ... * fn(xn) 在网格上的求值
+# 只在各坐标轴上计算一维因子，再用广播外积组合，避免 meshgrid 带来的整网格临时数组
+
+def _axis_views(factors, indexing):
+    """把一维因子变为可相互广播的视图，indexing 含义与 np.meshgrid 相同"""
+    n = len(factors)
+    views = []
+    for i, f in enumerate(factors):
+        shape = [1] * n
+        shape[i] = -1
+        views.append(np.reshape(f, shape))
+    if indexing == 'xy' and n >= 2:
+        # 'xy' 下前两维为 (y, x)，与 np.meshgrid 默认一致
+        views[0], views[1] = views[0].swapaxes(0, 1), views[1].swapaxes(0, 1)
+    elif indexing != 'ij' and indexing != 'xy':
+        raise ValueError(f"未知的索引方式: {indexing}")
+    return views
+
+def outer_product(factors, dtype=float, sparse=False, indexing='ij', out=None):
+    """
+    一维因子的外积 factors[0][i] * factors[1][j] * ...
+    sparse=True 时返回可广播的因子视图列表而不展开（惰性），
+    否则写入一个预分配数组，全程不产生其他整网格大小的临时数组
+    """
+    factors = [np.asarray(f, dtype=dtype).ravel() for f in factors]
+    if not factors:
+        raise ValueError("至少需要一个因子")
+    views = _axis_views(factors, indexing)
+    if sparse:
+        return views
+    shape = np.broadcast_shapes(*(v.shape for v in views))
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"out 的形状应为 {shape}")
+    if len(views) == 1:
+        out[...] = views[0]
+        return out
+    np.multiply(views[0], views[1], out=out)
+    for v in views[2:]:
+        out *= v
+    return out
+
+def separable_grid(funcs, *coords, dtype=float, sparse=False, indexing='ij', out=None):
+    """
+    在 coords 张成的网格上求可分离函数的值：第 i 个因子为 funcs[i](coords[i])
+    funcs 也可以是单个函数，表示各维使用同一个因子
+    """
+    if callable(funcs):
+        funcs = [funcs] * len(coords)
+    if len(funcs) != len(coords):
+        raise ValueError("因子函数个数与坐标轴个数不一致")
+    factors = [f(np.asarray(c, dtype=dtype)) for f, c in zip(funcs, coords)]
+    return outer_product(factors, dtype, sparse, indexing, out)
+
+def gaussian_nd(*coords, a=1.0, center=0.0, dtype=float, sparse=False, indexing='ij', out=None):
+    """
+    n 维高斯函数 exp(-a * |x - center|^2)，只做 sum(len(c)) 次指数运算
+    dtype=np.float32 时内存减半；a、center 可以是标量或每维一个值
+    """
+    a = np.broadcast_to(a, len(coords))
+    center = np.broadcast_to(center, len(coords))
+    funcs = [lambda x, ai=ai, ci=ci: np.exp(-ai * (x - ci)**2) for ai, ci in zip(a, center)]
+    return separable_grid(funcs, *coords, dtype=dtype, sparse=sparse, indexing=indexing, out=out)
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.fft import fft, fftfreq, fftshift
+from scipy.fft import fftshift
+
+from dispersion import DispersionPropagator
 
 # 设置参数
 N = 2048  # 采样点数
@@ -21,31 +23,20 @@ def create_smooth_triangular_wave(t):
     
     return wave
 
-# 色散函数：模拟频率依赖的相位变化
-def apply_dispersion(wave_t, t, dispersion_factor=0.5):
-    # 傅里叶变换到频域
-    wave_f = fft(wave_t)
-    freq = fftfreq(len(t), dt)
-    
-    # 色散效应：相位随频率平方变化
-    # 在色散介质中，不同频率分量传播速度不同
-    dispersion = np.exp(1j * dispersion_factor * freq**2 * len(t) * 0.001)
-    
-    # 应用色散
-    wave_f_dispersed = wave_f * dispersion
-    
-    # 回到时域
-    wave_dispersed = np.real(np.fft.ifft(wave_f_dispersed))
-    
-    return wave_dispersed, wave_f, wave_f_dispersed, freq
-
 # 创建初始波形
 initial_wave = create_smooth_triangular_wave(t)
 
+# 色散：模拟频率依赖的相位变化
+# 在色散介质中，不同频率分量传播速度不同，相位随频率平方变化
+# 传播器只构造一次，初始频谱与相位核在其中缓存
+propagator = DispersionPropagator(initial_wave, dt)
+dispersion_factor = 2.0
+
 # 应用色散（展宽效应）
-dispersed_wave, initial_freq_domain, dispersed_freq_domain, freq = apply_dispersion(
-    initial_wave, t, dispersion_factor=2.0
-)
+dispersed_wave = propagator.propagate(dispersion_factor)
+initial_freq_domain = propagator.wave_f
+dispersed_freq_domain = propagator.spectrum(dispersion_factor)
+freq = propagator.freq
 
 # 计算频谱幅度
 freq_magnitude_initial = np.abs(fftshift(initial_freq_domain))
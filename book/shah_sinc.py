@@ -1,18 +1,40 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.special import digamma
 
 # 近似狄拉克梳状分布的卷积和
 # 公式: sum_{k=-N}^N sinc(t-k)
 
+def _alt_harmonic(x):
+    """beta(x) = sum_{k>=0} (-1)^k / (x+k) = (psi((x+1)/2) - psi(x/2)) / 2"""
+    return 0.5 * (digamma(0.5 * (x + 1)) - digamma(0.5 * x))
+
+def sinc_comb_sum(t, N):
+    """
+    计算 sum_{k=-N}^N sinc(t-k)，代价与 N 无关
+    提出 sin(pi t) 后交错级数 sum (-1)^k / (t-k) 可用 beta 函数写成闭式，
+    再利用 beta(t) + beta(1-t) = pi / sin(pi t) 得到
+    sum_{k=-N}^N sinc(t-k) = 1 + (-1)^N * sin(pi t)/pi * [beta(N+1+t) - beta(N+1-t)]
+    整数 t 处直接取精确值：|t| <= N 时为 1，否则为 0
+    """
+    t = np.asarray(t, dtype=float)
+    m = np.round(t)
+    is_int = t == m
+    # 先约化到 [-1/2, 1/2] 再求正弦，避免 |t| 很大时 sin(pi t) 损失精度
+    sin_pi_t = np.sin(np.pi * (t - m)) * np.where(m % 2 == 0, 1.0, -1.0)
+    sign = -1.0 if N % 2 else 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tail = _alt_harmonic(N + 1 + t) - _alt_harmonic(N + 1 - t)
+        y = 1 + sign * sin_pi_t / np.pi * tail
+    return np.where(is_int, (np.abs(m) <= N).astype(float), y)
+
 def plot_shah_sinc(N_list, t_range=(-5, 5), num=2000):
     fig, axes = plt.subplots(2, 2, figsize=(12, 8))
     axes = axes.flatten()
     for idx, N in enumerate(N_list):
         t_range = (-1.5*N, 1.5*N)
         t = np.linspace(t_range[0], t_range[1], num)
-        y = np.zeros_like(t)
-        for k in range(-N, N+1):
-            y += np.sinc(t - k)
+        y = sinc_comb_sum(t, N)
         axes[idx].plot(t, y)
         axes[idx].set_title(f"N={N}")
         axes[idx].set_xlabel("t")
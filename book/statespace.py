@@ -0,0 +1,124 @@
+from functools import lru_cache
+
+import numpy as np
+from scipy.linalg import expm
+
+# 零阶保持（ZOH）离散化的线性时不变状态空间仿真:
+#   dx/dt = A x + B u,  y = C x + D u
+#   x[k+1] = Ad x[k] + Bd u[k],  Ad = exp(A dt),  Bd = int_0^dt exp(A s) ds B
+# 参数可以带一个批量维，多组参数在同一次堆叠矩阵乘法中推进
+
+@lru_cache(maxsize=64)
+def _zoh_cached(A_bytes, B_bytes, P, n, m, dt):
+    A = np.frombuffer(A_bytes).reshape(P, n, n)
+    B = np.frombuffer(B_bytes).reshape(P, n, m)
+    # 增广矩阵 [[A, B], [0, 0]] 的指数右上块即为 Bd
+    M = np.zeros((P, n + m, n + m))
+    M[:, :n, :n] = A
+    M[:, :n, n:] = B
+    E = expm(M * dt)
+    Ad, Bd = E[:, :n, :n].copy(), E[:, :n, n:].copy()
+    Ad.flags.writeable = False
+    Bd.flags.writeable = False
+    return Ad, Bd
+
+def zoh_discretize(A, B, dt):
+    """
+    返回只读的 (Ad, Bd)，形状 (P, n, n) 与 (P, n, m)；A、B 可带批量维 P，
+    按 (A, B, dt) 的内容缓存，同一组参数重复仿真时不再计算矩阵指数
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    if A.ndim == 2:
+        A = A[None]
+    if B.ndim == 2:
+        B = B[None]
+    P = max(len(A), len(B))
+    A = np.ascontiguousarray(np.broadcast_to(A, (P,) + A.shape[1:]))
+    B = np.ascontiguousarray(np.broadcast_to(B, (P,) + B.shape[1:]))
+    n, m = B.shape[1:]
+    if A.shape[1:] != (n, n):
+        raise ValueError("A 必须是 n x n 矩阵，B 必须是 n x m 矩阵")
+    return _zoh_cached(A.tobytes(), B.tobytes(), P, n, m, float(dt))
+
+def _linear_recurrence(Ad, b, x0, block):
+    """
+    x[k+1] = Ad x[k] + b[k] 的全部状态 x[0..N-1] 与末状态 x[N]
+    Ad: (P, n, n), b: (P, N, n), x0: (P, n)
+
+    把序列分成长为 block 的块：块内零初态的响应是 b 与 Ad 的幂的卷积，
+    写成一个 (block*n) x ((block+1)*n) 的分块下三角矩阵，所有块一次矩阵乘法算完；
+    各块起点的状态满足以 Ad^block 为转移矩阵的同类递推，递归求解。
+    每个样本的工作量为 O(block * n^2)，与序列长度无关
+    """
+    P, N, n = b.shape
+    if N <= block:
+        xs = np.empty((P, N, n))
+        x = x0
+        for k in range(N):
+            xs[:, k] = x
+            x = np.einsum('pij,pj->pi', Ad, x) + b[:, k]
+        return xs, x
+
+    M = block
+    powers = np.empty((P, M + 1, n, n))
+    powers[:, 0] = np.eye(n)
+    for j in range(M):
+        powers[:, j + 1] = powers[:, j] @ Ad
+    # T[j, i] = Ad^(j-1-i)（i < j），第 j 行块给出块内第 j 个状态，j = M 为块末状态
+    T = np.zeros((P, M + 1, n, M, n))
+    for j in range(1, M + 1):
+        for i in range(j):
+            T[:, j, :, i, :] = powers[:, j - 1 - i]
+    T = T.reshape(P, (M + 1) * n, M * n)
+
+    nb = -(-N // M)
+    padded = np.zeros((P, nb * M, n))
+    padded[:, :N] = b
+    q = (padded.reshape(P, nb, M * n) @ T.transpose(0, 2, 1)).reshape(P, nb, M + 1, n)
+
+    starts, _ = _linear_recurrence(powers[:, M], q[:, :, M], x0, block)
+    xs = np.einsum('pjab,pkb->pkja', powers[:, :M], starts) + q[:, :, :M]
+    xs = xs.reshape(P, nb * M, n)[:, :N]
+    x_end = np.einsum('pij,pj->pi', Ad, xs[:, -1]) + b[:, -1]
+    return xs, x_end
+
+class StateSpaceSimulator:
+    """
+    连续时间 LTI 系统的 ZOH 离散仿真；A、B、C、D 可带批量维，表示多组参数
+    simulate() 从当前状态出发推进任意输入序列并保留末状态，可分段连续调用
+    """
+
+    def __init__(self, A, B, C, D=None, dt=1.0, block=32):
+        self.Ad, self.Bd = zoh_discretize(A, B, dt)
+        P, n, m = self.Bd.shape
+        C = np.asarray(C, dtype=float)
+        self.C = np.broadcast_to(C if C.ndim == 3 else C[None], (P,) + C.shape[-2:])
+        if self.C.shape[2] != n:
+            raise ValueError("C 的列数必须等于状态维数")
+        D = np.zeros((self.C.shape[1], m)) if D is None else np.asarray(D, dtype=float)
+        self.D = np.broadcast_to(D if D.ndim == 3 else D[None], (P, self.C.shape[1], m))
+        self.dt = dt
+        self.block = block
+        self.reset()
+
+    def reset(self, x0=None):
+        """把状态置为 x0（默认零状态），形状 (n,) 或 (P, n)"""
+        P, n, _ = self.Bd.shape
+        self.x = np.zeros((P, n)) if x0 is None else np.array(np.broadcast_to(x0, (P, n)), dtype=float)
+
+    def simulate(self, u):
+        """
+        推进输入序列 u，形状 (N,)、(N, m) 或 (P, N, m)，
+        返回输出 y，形状 (P, N, p)；第 k 个输出对应时刻 k*dt（相对本段起点）
+        """
+        P, n, m = self.Bd.shape
+        u = np.asarray(u, dtype=float)
+        if u.ndim == 1:
+            u = u[:, None]
+        u = np.broadcast_to(u, (P,) + u.shape[-2:])
+        if u.shape[2] != m:
+            raise ValueError("输入维数与 B 的列数不一致")
+        b = u @ self.Bd.transpose(0, 2, 1)
+        xs, self.x = _linear_recurrence(self.Ad, b, self.x, self.block)
+        return xs @ self.C.transpose(0, 2, 1) + u @ self.D.transpose(0, 2, 1)
@@ -2,30 +2,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+from riemann_sphere import inverse_stereographic, sphere_mesh
+
 # 设置中文字体，防止乱码 (Try to set a font that supports Chinese, fallback to default if not found)
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'Microsoft YaHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
-def inverse_stereographic(x, y):
-    """
-    Maps a point (x, y) on the complex plane to the unit sphere.
-    Projection from North Pole (0, 0, 1) to the plane z=0.
-    """
-    denom = x**2 + y**2 + 1
-    X = 2*x / denom
-    Y = 2*y / denom
-    Z = (x**2 + y**2 - 1) / denom
-    return X, Y, Z
-
 fig = plt.figure(figsize=(8, 8))
 ax = fig.add_subplot(111, projection='3d')
 
 # 1. 绘制单位球 (Draw the unit sphere)
-u = np.linspace(0, 2 * np.pi, 50)
-v = np.linspace(0, np.pi, 50)
-x_sphere = np.outer(np.cos(u), np.sin(v))
-y_sphere = np.outer(np.sin(u), np.sin(v))
-z_sphere = np.outer(np.ones(np.size(u)), np.cos(v))
+# 经纬网格按分辨率缓存，重复绘制时不再重建
+x_sphere, y_sphere, z_sphere = sphere_mesh(50, 50)[0]
 
 # 绘制半透明球面
 ax.plot_surface(x_sphere, y_sphere, z_sphere, color='c', alpha=0.1, edgecolor='none')
@@ -54,12 +42,12 @@ ax.text(N[0], N[1], N[2]+0.1, 'N (0,0,1)', fontsize=10)
 # 点1：单位圆内 (Inside Unit Circle) -> 南半球 (Southern Hemisphere)
 # z1 = 0.6 + 0.2i (First quadrant, small angle)
 p1_plane = np.array([0.6, 0.2, 0])
-p1_sphere = inverse_stereographic(p1_plane[0], p1_plane[1])
+p1_sphere = inverse_stereographic(p1_plane[0] + 1j * p1_plane[1])
 
 # 点2：单位圆外 (Outside Unit Circle) -> 北半球 (Northern Hemisphere)
 # z2 = -1.0 + 1.5i (Second quadrant, different angle)
 p2_plane = np.array([-1.0, 1.5, 0])
-p2_sphere = inverse_stereographic(p2_plane[0], p2_plane[1])
+p2_sphere = inverse_stereographic(p2_plane[0] + 1j * p2_plane[1])
 
 # 4. 绘制点和连线 (Plot points and lines)
 
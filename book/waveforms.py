@@ -0,0 +1,41 @@
+import numpy as np
+
+# 周期波形发生器：相位只用一次取模运算得到，代价与周期个数无关
+
+def _phase(t, period, t0):
+    """t 在所在周期内的相对位置，取值 [0, 1)"""
+    return np.mod((np.asarray(t, dtype=float) - t0) / period, 1.0)
+
+def pulse_train(t, period, duty=0.5, t0=0.0):
+    """
+    周期矩形脉冲：每个周期中 [t0 + n*period, t0 + n*period + duty*period] 上为 1，其余为 0
+    以 0 为中心、宽度为 w 的脉冲取 duty = w/period, t0 = -w/2
+    """
+    return (_phase(t, period, t0) <= duty).astype(float)
+
+def triangle_wave(t, period, duty=0.5, t0=0.0):
+    """
+    周期三角波：从 t0 起在 duty*period 内由 0 升到 1，其余时间降回 0
+    duty=0.5 为对称三角波，duty 趋于 1 时退化为锯齿波
+    duty 可以是数组，与 t 按广播规则组合（与 pulse_train 一致）
+    """
+    phase = _phase(t, period, t0)
+    # duty 截到 [0, 1]：duty=0 时只有下降段 1 - phase，duty=1 时只有上升段 phase
+    duty = np.clip(np.asarray(duty, dtype=float), 0.0, 1.0)
+    rise = phase / np.where(duty > 0, duty, 1.0)
+    fall = (1 - phase) / np.where(duty < 1, 1 - duty, 1.0)
+    return np.where(phase < duty, rise, fall)
+
+def sawtooth_wave(t, period, t0=0.0):
+    """周期锯齿波：每个周期从 t0 起由 0 线性升到 1"""
+    return _phase(t, period, t0)
+
+def waveform_chunks(wave, n_samples, fs, chunk_size=2**20, t_start=0.0, **params):
+    """
+    分块产生长波形序列，每次只生成 chunk_size 个采样点，
+    时间由整数采样下标换算，长序列也不会累积舍入误差
+    例: for block in waveform_chunks(pulse_train, 10**8, fs, period=2, duty=0.5): ...
+    """
+    for start in range(0, n_samples, chunk_size):
+        idx = np.arange(start, min(start + chunk_size, n_samples))
+        yield wave(t_start + idx / fs, **params)
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# book/ 下的模块以脚本方式互相导入，测试时把该目录加入搜索路径
+BOOK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'book')
+if BOOK_DIR not in sys.path:
+    sys.path.insert(0, BOOK_DIR)
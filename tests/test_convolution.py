@@ -0,0 +1,20 @@
+import numpy as np
+
+from convolution import StreamingConvolver, convolve
+
+def test_stream_matches_full_convolution():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(5000)
+    h = rng.standard_normal(37)
+    conv = StreamingConvolver(h, dt=0.5, block_size=256)
+    y = np.concatenate(list(conv.stream(np.array_split(x, 13))))
+    assert np.allclose(y, convolve(x, h, dt=0.5, mode='full'))
+    # flush 之后可以开始下一段独立的流
+    y2 = np.concatenate(list(conv.stream([x[:100]])))
+    assert np.allclose(y2, convolve(x[:100], h, dt=0.5, mode='full'))
+
+def test_empty_stream_yields_nothing():
+    conv = StreamingConvolver(np.ones(5))
+    assert list(conv.stream([])) == []
+    assert list(conv.stream([np.empty(0)])) == []
+    assert len(conv.flush()) == 0
@@ -0,0 +1,19 @@
+import numpy as np
+
+from convolution import convolve
+from filters import design_fir, fir_filter
+
+def test_fir_filter_same_length_as_input():
+    x = np.random.default_rng(0).standard_normal(500)
+    y = fir_filter(x, 'low', 101)
+    assert y.shape == x.shape
+    assert np.allclose(y, convolve(x, design_fir('low', 101), mode='same'))
+
+def test_fir_filter_input_shorter_than_taps():
+    x = np.zeros(10)
+    x[4] = 1.0
+    y = fir_filter(x, 'band', 31)
+    assert y.shape == x.shape
+    # 单位冲激的输出是以冲激为中心的滤波器系数
+    h = design_fir('band', 31)
+    assert np.allclose(y, h[15 - 4:15 - 4 + 10])
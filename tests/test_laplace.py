@@ -0,0 +1,44 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from circuits import rlc_step_current
+from laplace import _nodes_weights, invert_laplace, rational
+
+def test_euler_matches_rlc_step_current():
+    # 接入直流电压 E 的 RLC 串联电路: I(s) = E / (L s^2 + R s + 1/C)，三种阻尼一次求出
+    R = np.array([3.0, 2.0, 0.5])
+    L, C = 1.0, 1.0
+    H = rational([1.0], np.column_stack([np.full_like(R, L), R, np.full_like(R, 1 / C)]))
+    t = np.linspace(0.1, 20, 200)
+    f = invert_laplace(H, t)
+    expected = rlc_step_current(t[None, :], R[:, None], L, C)
+    assert f.shape == expected.shape
+    assert np.allclose(f, expected, rtol=0, atol=1e-9)
+
+def test_talbot_on_real_axis_poles():
+    # F(s) = 1/((s+1)(s+3))，f(t) = (e^{-t} - e^{-3t}) / 2
+    H = rational([1.0], [1.0, 4.0, 3.0])
+    t = np.linspace(0.05, 10, 50)
+    expected = (np.exp(-t) - np.exp(-3 * t)) / 2
+    assert np.allclose(invert_laplace(H, t, method='talbot'), expected, rtol=0, atol=1e-12)
+    assert np.isclose(invert_laplace(H, 2.0, method='talbot'), (np.exp(-2) - np.exp(-6)) / 2)
+
+def test_talbot_warns_outside_the_contour():
+    H = rational([1.0], [1.0, 0.0, 1.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert np.isclose(invert_laplace(H, 5.0, method='talbot'), np.sin(5.0), atol=1e-10)
+    with pytest.warns(RuntimeWarning):
+        invert_laplace(H, 30.0, method='talbot')
+    # 欧拉方法不受此限制
+    assert np.isclose(invert_laplace(H, 30.0), np.sin(30.0), atol=1e-8)
+
+def test_nodes_are_cached_and_read_only():
+    for method in ('euler', 'talbot'):
+        a, w = _nodes_weights(method, 12)
+        assert _nodes_weights(method, 12)[0] is a
+        assert not a.flags.writeable and not w.flags.writeable
+    with pytest.raises(ValueError):
+        invert_laplace(lambda s: 1 / s, 1.0, method='stehfest')
@@ -0,0 +1,61 @@
+import numpy as np
+
+from lattice import iter_lattice_points, lattice_points, sample_and_reconstruct
+
+def _brute_force(A, lo, hi, K=400):
+    k = np.arange(-K, K + 1)
+    K1, K2 = np.meshgrid(k, k, indexing='ij')
+    P = np.stack([K1.ravel(), K2.ravel()], axis=1) @ np.asarray(A, dtype=float).T
+    inside = np.all((P >= lo) & (P <= hi), axis=1)
+    return P[inside]
+
+def _sorted_rows(P):
+    return P[np.lexsort(np.round(P, 9).T[::-1])]
+
+def test_lattice_points_match_brute_force():
+    lo, hi = np.array([-3.2, -2.5]), np.array([4.1, 3.7])
+    for A in ([[1.0, 0.5], [0.0, np.sqrt(3) / 2]],   # 六角格
+              [[1.0, 7.0], [0.2, 1.5]],                # 斜交严重的基
+              [[0.7, 0.0], [0.0, 1.3]]):
+        P = lattice_points(A, lo, hi)
+        assert np.all((P >= lo - 1e-9) & (P <= hi + 1e-9))
+        assert np.allclose(_sorted_rows(P), _sorted_rows(_brute_force(A, lo, hi)))
+
+def test_iter_lattice_points_respects_chunk_size():
+    A = [[0.1, 0.0], [0.0, 0.1]]
+    chunks = list(iter_lattice_points(A, (0, 0), (5, 5), max_points=200))
+    assert sum(len(c) for c in chunks) == 51 * 51
+    assert all(len(c) <= 200 for c in chunks)
+
+HEX = 2 * np.array([[1.0, 0.5], [0.0, np.sqrt(3) / 2]])
+
+def _gauss(width):
+    return lambda x, y: np.exp(-np.pi * (x**2 + y**2) / width**2)
+
+def test_samples_lie_on_the_sampling_lattice():
+    K = 32
+    r = sample_and_reconstruct(_gauss(1.0), HEX, K, 4)
+    S = np.linalg.inv(HEX).T
+    i = np.arange(K) - K // 2
+    I, J = np.meshgrid(i, i, indexing='ij')
+    x = S[0, 0] * I + S[0, 1] * J
+    y = S[1, 0] * I + S[1, 1] * J
+    assert np.allclose(r.samples, _gauss(1.0)(x, y))
+    assert np.isclose(r.density, abs(np.linalg.det(HEX)))
+
+def test_band_limited_function_is_recovered():
+    # 频谱几乎全部落在基本胞腔内时重建误差很小，频谱越宽混叠越严重
+    errors = [sample_and_reconstruct(_gauss(w), HEX, 64, 4).alias_error for w in (2.0, 1.0, 0.5)]
+    assert errors[0] < 1e-4
+    assert errors[0] < errors[1] < errors[2]
+    # 六角格的 Voronoi 胞腔比平行四边形胞腔更贴合圆对称的频谱
+    assert sample_and_reconstruct(_gauss(1.0), HEX, 64, 4, cell='voronoi').alias_error < errors[1]
+
+def test_batched_functions_match_single_runs():
+    def f(x, y):
+        return np.stack([_gauss(1.0)(x, y), _gauss(2.0)(x, y)])
+    batch = sample_and_reconstruct(f, HEX, 32, 4)
+    for b, w in enumerate((1.0, 2.0)):
+        single = sample_and_reconstruct(_gauss(w), HEX, 32, 4)
+        assert np.allclose(batch.reconstructed[b], single.reconstructed)
+        assert np.isclose(batch.alias_error[b], single.alias_error)
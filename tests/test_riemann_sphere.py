@@ -0,0 +1,25 @@
+import numpy as np
+
+from laplace import rational
+from riemann_sphere import sphere_mesh, sphere_values
+
+def test_sphere_values_finite_at_north_pole():
+    # 真有理函数在无穷远处趋于 0，北极一列应取该极限而不是 nan
+    H = rational([1.0], [1.0, 0.5, 1.0])
+    xyz, values = sphere_values(lambda s: np.abs(H(s)), 40, 30)
+    assert values.shape == xyz.shape[1:]
+    assert np.all(np.isfinite(values))
+    assert np.allclose(values[:, 0], 0.0, atol=1e-9)
+
+def test_sphere_values_constant_limit():
+    # 分子分母同阶时极限为首项系数之比
+    H = rational([2.0, 1.0], [1.0, 3.0])
+    _, values = sphere_values(H, 20, 20)
+    assert np.all(np.isfinite(values))
+    assert np.allclose(values[:, 0], 2.0, rtol=1e-5)
+
+def test_sphere_mesh_is_cached_and_read_only():
+    xyz, z_plane = sphere_mesh(16, 12)
+    assert sphere_mesh(16, 12)[0] is xyz
+    assert not xyz.flags.writeable and not z_plane.flags.writeable
+    assert np.allclose(np.sum(xyz**2, axis=0), 1.0)
@@ -0,0 +1,35 @@
+import numpy as np
+
+from sampling import sinc_reconstruct
+
+def _brute_force(t, t_samples, samples, fs):
+    return np.sinc(fs * (t[:, None] - t_samples[None, :])) @ samples
+
+def test_direct_matches_brute_force_on_incommensurate_grid():
+    # 输出间隔与采样间隔不成整数比，走 'direct' 路径；分块很小以覆盖块边界
+    rng = np.random.default_rng(0)
+    fs = 4.0
+    t_samples = np.arange(80) / fs - 10
+    samples = rng.standard_normal(80)
+    t = np.linspace(-12, 12, 997)
+    y = sinc_reconstruct(t, t_samples, samples, fs, max_block_bytes=8 * 80 * 50)
+    assert np.allclose(y, _brute_force(t, t_samples, samples, fs), rtol=0, atol=1e-13)
+
+def test_direct_exact_at_sample_points():
+    # 输出点与采样点重合（以及非常接近）时取 t = t_k 处的精确值
+    rng = np.random.default_rng(1)
+    t_samples = np.sort(rng.uniform(-5, 5, 40))
+    samples = rng.standard_normal(40) + 1j * rng.standard_normal(40)
+    t = np.r_[t_samples, t_samples + 1e-12, rng.uniform(-6, 6, 100)]
+    y = sinc_reconstruct(t, t_samples, samples, 1.3, method='direct')
+    assert np.allclose(y, _brute_force(t, t_samples, samples, 1.3), rtol=0, atol=1e-13)
+
+def test_fft_and_direct_agree():
+    rng = np.random.default_rng(2)
+    fs = 2.0
+    t_samples = np.arange(50) / fs
+    samples = rng.standard_normal(50)
+    t = np.arange(400) / (8 * fs) - 3
+    y_fft = sinc_reconstruct(t, t_samples, samples, fs, method='fft')
+    y_direct = sinc_reconstruct(t, t_samples, samples, fs, method='direct')
+    assert np.allclose(y_fft, y_direct, rtol=0, atol=1e-12)
@@ -0,0 +1,21 @@
+import numpy as np
+
+from shah_sinc import sinc_comb_sum
+
+def _brute_force(t, N):
+    k = np.arange(-N, N + 1)
+    return np.array([np.sum(np.sinc(ti - k)) for ti in t])
+
+def test_matches_brute_force_small_N():
+    t = np.linspace(-7.3, 7.3, 201)
+    for N in (0, 1, 2, 5):
+        assert np.allclose(sinc_comb_sum(t, N), _brute_force(t, N), rtol=0, atol=1e-13)
+
+def test_matches_brute_force_large_N():
+    t = np.random.default_rng(0).uniform(-10, 10, 50)
+    N = 10**5
+    assert np.allclose(sinc_comb_sum(t, N), _brute_force(t, N), rtol=0, atol=1e-12)
+
+def test_integer_t_is_exact():
+    t = np.arange(-6, 7, dtype=float)
+    assert np.array_equal(sinc_comb_sum(t, 4), (np.abs(t) <= 4).astype(float))
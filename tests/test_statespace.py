@@ -0,0 +1,48 @@
+import numpy as np
+
+from circuits import rlc_state_space, rlc_step_current
+from statespace import StateSpaceSimulator, _linear_recurrence, zoh_discretize
+
+def _naive_recurrence(Ad, b, x0):
+    xs = np.empty(b.shape)
+    x = x0
+    for k in range(b.shape[1]):
+        xs[:, k] = x
+        x = np.einsum('pij,pj->pi', Ad, x) + b[:, k]
+    return xs, x
+
+def test_blocked_recurrence_matches_loop():
+    # N 超过 block^2，递归至少两层，且最后一块不满
+    rng = np.random.default_rng(0)
+    P, N, n = 3, 1000, 2
+    Ad = 0.3 * rng.standard_normal((P, n, n))
+    b = rng.standard_normal((P, N, n))
+    x0 = rng.standard_normal((P, n))
+    xs, x_end = _linear_recurrence(Ad, b, x0, 8)
+    xs_ref, x_end_ref = _naive_recurrence(Ad, b, x0)
+    assert np.allclose(xs, xs_ref, rtol=1e-12, atol=1e-12)
+    assert np.allclose(x_end, x_end_ref, rtol=1e-12, atol=1e-12)
+
+def test_rlc_step_matches_analytic_current():
+    # 过阻尼、临界阻尼、欠阻尼三组参数一次仿真
+    R = np.array([3.0, 2.0, 0.5])
+    L, C, dt = 1.0, 1.0, 0.01
+    sim = StateSpaceSimulator(*rlc_state_space(R, L, C), dt=dt)
+    t = np.arange(2000) * dt
+    i = sim.simulate(np.ones(len(t)))[:, :, 0]
+    expected = rlc_step_current(t[None, :], R[:, None], L, C)
+    assert np.allclose(i, expected, rtol=0, atol=1e-12)
+
+def test_segmented_simulation_continues_state():
+    A, B, C, D = rlc_state_space(1.0, 1.0, 1.0)
+    u = np.sin(np.arange(500) * 0.05)
+    whole = StateSpaceSimulator(A, B, C, D, dt=0.05).simulate(u)
+    sim = StateSpaceSimulator(A, B, C, D, dt=0.05)
+    parts = np.concatenate([sim.simulate(u[:123]), sim.simulate(u[123:])], axis=1)
+    assert np.allclose(parts, whole, rtol=0, atol=1e-13)
+
+def test_zoh_discretize_is_cached():
+    A, B, _, _ = rlc_state_space(1.0, 1.0, 1.0)
+    Ad, Bd = zoh_discretize(A, B, 0.1)
+    assert zoh_discretize(A.copy(), B.copy(), 0.1)[0] is Ad
+    assert not Ad.flags.writeable and not Bd.flags.writeable
@@ -0,0 +1,21 @@
+import numpy as np
+
+from waveforms import pulse_train, triangle_wave
+
+def test_triangle_wave_broadcasts_array_duty():
+    t = np.linspace(0, 4, 401)
+    duty = np.array([0.0, 0.25, 0.5, 1.0])
+    y = triangle_wave(t, 2.0, duty=duty[:, None])
+    assert y.shape == (4, 401)
+    for d, row in zip(duty, y):
+        assert np.allclose(row, triangle_wave(t, 2.0, duty=float(d)))
+    # 与 pulse_train 相同的广播行为
+    assert pulse_train(t, 2.0, duty=duty[:, None]).shape == y.shape
+
+def test_triangle_wave_degenerate_duty():
+    t = np.linspace(0, 1.9, 20)
+    phase = t / 2.0
+    assert np.allclose(triangle_wave(t, 2.0, duty=0.0), 1 - phase)
+    assert np.allclose(triangle_wave(t, 2.0, duty=-1.0), 1 - phase)
+    assert np.allclose(triangle_wave(t, 2.0, duty=1.0), phase)
+    assert np.allclose(triangle_wave(t, 2.0, duty=0.5), np.where(phase < 0.5, 2 * phase, 2 - 2 * phase))